@@ -6,6 +6,7 @@ import shutil
 import joblib
 import os
 import sys
+from dataclasses import dataclass
 
 # --- Path Correction ---
 HELPER_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -15,6 +16,7 @@ if PROJECT_ROOT not in sys.path:
 
 # --- Core Project Imports ---
 from shallnotcrash.fg_interface.protocols.telnet import TelnetProtocol
+from shallnotcrash.fg_interface.exceptions import FGCommError
 from shallnotcrash.constants.connection import FGConnectionConstants
 from shallnotcrash.constants.flightgear import FGProps
 # [MODIFIED] Import the AnomalyDetector CLASS, not the removed global singleton.
@@ -23,6 +25,37 @@ from shallnotcrash.emergency.analyzers.pattern_recognizer import PatternRecogniz
 
 MODEL_PATH = os.path.join(PROJECT_ROOT, "models", "c172p_emergency_model_improved.joblib")
 
+# (key, property path, default) for every value read per tick, fetched in one batched round-trip.
+TELEMETRY_PROPS = (
+    ('rpm', FGProps.ENGINE.RPM, 0.0), ('oil_pressure', FGProps.ENGINE.OIL_PRESS_PSI, 0.0),
+    ('fuel_flow', FGProps.ENGINE.FUEL_FLOW_GPH, 0.0), ('g_load', FGProps.FLIGHT.G_LOAD, 1.0),
+    ('vibration', FGProps.ENGINE.VIBRATION, 0.0), ('bus_volts', FGProps.ELECTRICAL.BUS_VOLTS, 0.0),
+    ('oil_temp', FGProps.ENGINE.OIL_TEMP_F, 0.0), ('cht', FGProps.ENGINE.CHT_F, 0.0),
+    ('egt', FGProps.ENGINE.EGT_F, 0.0),
+    ('airspeed', FGProps.FLIGHT.AIRSPEED_KT, 0.0),
+    ('yaw_rate', FGProps.FLIGHT.YAW_RATE_DEGPS, 0.0),
+    ('roll', FGProps.FLIGHT.ROLL_DEG, 0.0),
+    ('pitch', FGProps.FLIGHT.PITCH_DEG, 0.0),
+    ('lat', FGProps.FLIGHT.LATITUDE, 0.0), ('lng', FGProps.FLIGHT.LONGITUDE, 0.0),
+    ('heading', FGProps.FLIGHT.HEADING_DEG, 0.0), ('altitude', FGProps.FLIGHT.ALTITUDE_FT, 0.0)
+)
+TELEMETRY_PATHS = tuple(path for _, path, _ in TELEMETRY_PROPS)
+TELEMETRY_INTERVAL_NS = 500_000_000  # 2 Hz worker tick, paced on the monotonic clock
+# Failures a single read can raise: bad/closed reply, socket error or timeout, undecodable bytes.
+READ_ERRORS = (FGCommError, OSError, ValueError)
+# Fixed emergency_result payloads, shared by every packet in that state instead of rebuilt per tick
+GRACE_PERIOD_RESULT = {'pattern_type': 'GRACE_PERIOD'}
+NO_MODEL_RESULT = {'pattern_type': 'NO_MODEL'}
+DISCONNECTED_RESULT = {'pattern_type': 'DISCONNECTED'}
+
+@dataclass(slots=True)
+class TelemetrySample:
+    """One tick of raw FlightGear values; fields follow TELEMETRY_PROPS order."""
+    rpm: float; oil_pressure: float; fuel_flow: float; g_load: float
+    vibration: float; bus_volts: float; oil_temp: float; cht: float; egt: float
+    airspeed: float; yaw_rate: float; roll: float; pitch: float
+    lat: float; lng: float; heading: float; altitude: float
+
 def find_fgfs_executable() -> str:
     for path in ['/usr/games/fgfs', '/usr/bin/fgfs', 'fgfs']:
         if shutil.which(path): return path
@@ -39,9 +72,23 @@ def try_connect_fg(state: dict):
 def get_prop(fg, prop, default=0.0):
     try:
         return fg.get(prop) or default
-    except Exception:
+    except READ_ERRORS:
         return default
 
+def get_props(fg, props=TELEMETRY_PROPS, paths=TELEMETRY_PATHS) -> TelemetrySample:
+    """Reads all props in one pipelined request.
+
+    A property whose reply could not be parsed comes back as None and takes its own default.
+    If the batch itself fails (timeout, socket error, closed connection) every prop takes its
+    default for this tick: replies still in flight would pair single reads with the wrong
+    property, and the protocol discards them before its next read.
+    """
+    try:
+        values = fg.get_many(paths)
+    except READ_ERRORS:
+        values = [None] * len(props)
+    return TelemetrySample(*(value or default for (_, _, default), value in zip(props, values)))
+
 def telemetry_worker(state: dict):
     try:
         emergency_model = joblib.load(MODEL_PATH)
@@ -53,7 +100,9 @@ def telemetry_worker(state: dict):
     # These will hold the private instances for the current connection.
     pattern_recognizer = None
     anomaly_detector = None 
+    grace_scores = None  # All-zero scores over the raw telemetry keys, built on the first grace tick
     first_connection_established = False
+    next_tick_ns = time.monotonic_ns()
 
     while True:
         try:
@@ -66,35 +115,38 @@ def telemetry_worker(state: dict):
                 if not first_connection_established:
                     logging.info("FlightGear connection established. Initializing fresh detection system.")
                     # Create NEW, PRIVATE instances of the recognizer and detector.
-                    pattern_recognizer = PatternRecognizer(MODEL_PATH if emergency_model else None)
+                    # Reuse the artifact loaded above instead of reading the model file again on every connection.
+                    pattern_recognizer = PatternRecognizer(model_artifact=emergency_model)
                     anomaly_detector = AnomalyDetector()
                     first_connection_established = True
                 
-                fg = state['fg_interface']
+                t = get_props(state['fg_interface'])
                 raw_telemetry = {
-                    'rpm': get_prop(fg, FGProps.ENGINE.RPM), 'oil_pressure': get_prop(fg, FGProps.ENGINE.OIL_PRESS_PSI),
-                    'fuel_flow': get_prop(fg, FGProps.ENGINE.FUEL_FLOW_GPH), 'g_load': get_prop(fg, FGProps.FLIGHT.G_LOAD, default=1.0),
-                    'vibration': get_prop(fg, FGProps.ENGINE.VIBRATION), 'bus_volts': get_prop(fg, FGProps.ELECTRICAL.BUS_VOLTS),
-                    'oil_temp': get_prop(fg, FGProps.ENGINE.OIL_TEMP_F), 'cht': get_prop(fg, FGProps.ENGINE.CHT_F),
-                    'egt': get_prop(fg, FGProps.ENGINE.EGT_F), 'control_asymmetry': 0.0,
-                    'airspeed': get_prop(fg, FGProps.FLIGHT.AIRSPEED_KT),
-                    'yaw_rate': get_prop(fg, FGProps.FLIGHT.YAW_RATE_DEGPS),
-                    'roll': get_prop(fg, FGProps.FLIGHT.ROLL_DEG),
-                    'pitch': get_prop(fg, FGProps.FLIGHT.PITCH_DEG)
+                    'rpm': t.rpm, 'oil_pressure': t.oil_pressure,
+                    'fuel_flow': t.fuel_flow, 'g_load': t.g_load,
+                    'vibration': t.vibration, 'bus_volts': t.bus_volts,
+                    'oil_temp': t.oil_temp, 'cht': t.cht,
+                    'egt': t.egt, 'control_asymmetry': 0.0,
+                    'airspeed': t.airspeed,
+                    'yaw_rate': t.yaw_rate,
+                    'roll': t.roll,
+                    'pitch': t.pitch
                 }
                 data_packet.update({
-                    'lat': get_prop(fg, FGProps.FLIGHT.LATITUDE), 'lng': get_prop(fg, FGProps.FLIGHT.LONGITUDE),
-                    'heading': get_prop(fg, FGProps.FLIGHT.HEADING_DEG), 'speed': raw_telemetry['airspeed'],
-                    'altitude': get_prop(fg, FGProps.FLIGHT.ALTITUDE_FT), 'fg_connected': True, 'raw_telemetry': raw_telemetry
+                    'lat': t.lat, 'lng': t.lng,
+                    'heading': t.heading, 'speed': t.airspeed,
+                    'altitude': t.altitude, 'fg_connected': True, 'raw_telemetry': raw_telemetry
                 })
 
                 if pattern_recognizer and anomaly_detector:
-                    elapsed = time.time() - pattern_recognizer.startup_time
+                    elapsed = time.monotonic() - pattern_recognizer.startup_time
                     grace_is_active = elapsed < pattern_recognizer.STARTUP_GRACE_PERIOD
 
                     if grace_is_active:
-                        data_packet['emergency_result'] = {'pattern_type': 'GRACE_PERIOD'}
-                        data_packet['anomaly_scores'] = {k: 0.0 for k in raw_telemetry.keys()}
+                        if grace_scores is None:
+                            grace_scores = dict.fromkeys(raw_telemetry, 0.0)
+                        data_packet['emergency_result'] = GRACE_PERIOD_RESULT
+                        data_packet['anomaly_scores'] = grace_scores
                         data_packet['system_status'] = {'grace_period_remaining': pattern_recognizer.STARTUP_GRACE_PERIOD - elapsed}
                     else:
                         # Use the private, clean anomaly_detector instance.
@@ -111,10 +163,10 @@ def telemetry_worker(state: dict):
                         data_packet['anomaly_scores'] = {k: v.normalized_score for k, v in scores.items()}
                         data_packet['system_status'] = {'grace_period_remaining': 0}
                 else:
-                    data_packet.update({'emergency_result': {'pattern_type': 'NO_MODEL'}, 'anomaly_scores': {}, 'system_status': {}})
+                    data_packet.update({'emergency_result': NO_MODEL_RESULT, 'anomaly_scores': {}, 'system_status': {}})
             
             else: 
-                data_packet.update({'fg_connected': False, 'emergency_result': {'pattern_type': 'DISCONNECTED'},
+                data_packet.update({'fg_connected': False, 'emergency_result': DISCONNECTED_RESULT,
                                     'raw_telemetry': {}, 'anomaly_scores': {}, 'system_status': {}})
                 if first_connection_established:
                     logging.info("FG disconnected. Clearing detection state.")
@@ -126,7 +178,14 @@ def telemetry_worker(state: dict):
             except queue.Empty:
                 pass
             state['telemetry_queue'].put(data_packet)
-            time.sleep(0.5)
+
+            # Sleep to the next deadline so fetch/inference time doesn't stretch the tick.
+            next_tick_ns += TELEMETRY_INTERVAL_NS
+            now_ns = time.monotonic_ns()
+            if now_ns < next_tick_ns:
+                time.sleep((next_tick_ns - now_ns) / 1e9)
+            else:
+                next_tick_ns = now_ns
 
         except Exception as e:
             logging.error(f"FATAL ERROR in telemetry_worker: {e}", exc_info=True)
@@ -0,0 +1,54 @@
+# helpers/tests/test_flightgear.py
+import socket
+import unittest
+from unittest.mock import patch, MagicMock
+
+from helpers.flightgear import TELEMETRY_PROPS, TelemetrySample, get_props
+from shallnotcrash.fg_interface.protocols.telnet import TelnetProtocol
+
+DEFAULTS = TelemetrySample(*(default for _, _, default in TELEMETRY_PROPS))
+
+def _replies(values):
+    return "".join(f"{value}\r\n" for value in values).encode()
+
+class TestGetProps(unittest.TestCase):
+    """Test cases for the worker's batched telemetry read"""
+
+    def setUp(self):
+        self.patcher = patch('socket.socket')
+        self.socket_instance = MagicMock()
+        self.patcher.start().return_value = self.socket_instance
+        self.protocol = TelnetProtocol("localhost", 5500)
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_empty_reply_takes_its_own_default(self):
+        """Test that an unparseable reply only defaults its own property"""
+        values = [float(i + 1) for i in range(len(TELEMETRY_PROPS))]
+        replies = [str(v) for v in values]
+        replies[4] = ""  # vibration
+        self.socket_instance.recv.side_effect = [_replies(replies)]
+
+        sample = get_props(self.protocol)
+
+        self.assertEqual(sample.vibration, 0.0)
+        self.assertEqual(sample.rpm, 1.0)
+        self.assertEqual(sample.altitude, values[-1])
+        self.socket_instance.send.assert_not_called()
+
+    def test_timeout_mid_batch_returns_defaults_without_shifting(self):
+        """Test a batch that times out after k of N replies"""
+        n, k = len(TELEMETRY_PROPS), 5
+        first = [float(100 + i) for i in range(n)]
+        self.socket_instance.recv.side_effect = [_replies(first[:k]), socket.timeout("timed out")]
+
+        self.assertEqual(get_props(self.protocol), DEFAULTS)
+        self.socket_instance.send.assert_not_called()  # No single-read fallback
+
+        second = [float(200 + i) for i in range(n)]
+        self.socket_instance.recv.side_effect = [_replies(first[k:]), _replies(second)]
+        self.assertEqual(get_props(self.protocol), TelemetrySample(*second))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,11 +18,9 @@ class Cessna172P:
         """
         self.fg = fg_connection
         self.const = C172PConstants
-        self._systems = {
-            'fuel': FuelSystem(fg_connection),
-            'engine': EngineSystem(fg_connection),
-            'flight': FlightSystem(fg_connection)
-        }
+        self._fuel = FuelSystem(fg_connection)
+        self._engine = EngineSystem(fg_connection)
+        self._flight = FlightSystem(fg_connection)
         self._last_update = 0
         
     def get_telemetry(self) -> Dict[str, Any]:
@@ -46,14 +44,14 @@ class Cessna172P:
     def _get_fuel_status(self) -> Dict[str, Any]:
         """Get fuel system state with error handling"""
         try:
-            return self._systems['fuel'].update()
+            return self._fuel.update(self._last_update)
         except Exception as e:
             raise FuelSystemException(f"Fuel system error: {str(e)}") from e
     
     def _get_engine_status(self) -> Dict[str, Any]:
         """Get engine state with error handling"""
         try:
-            return self._systems['engine'].update()
+            return self._engine.update()
         except Exception as e:
             raise EngineException(
                 f"Engine monitoring failed: {str(e)}", 
@@ -63,7 +61,7 @@ class Cessna172P:
     def _get_flight_status(self) -> Dict[str, Any]:
         """Get flight state with error handling"""
         try:
-            return self._systems['flight'].update()
+            return self._flight.update()
         except Exception as e:
             raise FlightSystemException(f"Flight system error: {str(e)}") from e
     
@@ -1,37 +1,61 @@
 import time
 import random
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from ..constants import C172PConstants
 from ..exceptions import EngineException
 
+# Airframe limits are fixed, so they are resolved once at import instead of on every update
+_MAX_RPM = C172PConstants.ENGINE['MAX_RPM']
+_REDLINE_RPM = C172PConstants.ENGINE['REDLINE_RPM']
+_MAX_EGT = C172PConstants.ENGINE['MAX_EGT']
+
+# Resolved once; each update() result gets its own copy
+ENGINE_LIMITS = {
+    'max_rpm': _MAX_RPM,
+    'redline_rpm': _REDLINE_RPM,
+    'max_egt': _MAX_EGT,
+    'max_cht': 500,
+    'max_vibration': 10.0
+}
+
 class EngineSystem:
     """Monitors the Lycoming O-320-D2J engine in Cessna 172P with vibration simulation."""
     
+    # Property keys read on every update; their FGProps paths are resolved once per instance
+    PROP_KEYS = ('RPM', 'EGT_F', 'CHT_F', 'OIL_TEMP_F', 'OIL_PRESS_PSI', 'FUEL_FLOW_GPH')
+    
     def __init__(self, fg_connection):
         self.fg = fg_connection
         self.const = C172PConstants
+        self._prop_paths = {key: getattr(self.const.PROPERTIES.ENGINE, key) for key in self.PROP_KEYS}
+        self._prop_path_list = tuple(self._prop_paths[key] for key in self.PROP_KEYS)
         self._last_oil_change_hours = 0  # Track maintenance
         self._vibration_history = []  # For temporal analysis
         self._last_vibration_update = 0
         
     # ADD THIS METHOD
     def _get_prop(self, prop_key: str) -> float:
-        prop_path = getattr(self.const.PROPERTIES.ENGINE, prop_key)
+        prop_path = self._prop_paths.get(prop_key) or getattr(self.const.PROPERTIES.ENGINE, prop_key)
         response = self.fg.get(prop_path)
         if not response['success']:
             raise ValueError(f"Failed to read {prop_key}: {response.get('message', 'No error details')}")
         return float(response['data']['value'])
     
+    def _get_props(self) -> Tuple[float, ...]:
+        """Reads all PROP_KEYS in one round-trip (PROP_KEYS order), falling back to one read per key."""
+        response = self.fg.get_many(self._prop_path_list)
+        values = response['data'].get('values', ()) if response['success'] else ()
+        if len(values) != len(self.PROP_KEYS):  # Failed or short reply
+            return tuple(self._get_prop(key) for key in self.PROP_KEYS)
+        # Only a slot whose reply could not be parsed is read again on its own
+        return tuple(self._get_prop(key) if value is None else float(value)
+                     for key, value in zip(self.PROP_KEYS, values))
+    
     def update(self) -> Dict[str, Any]:
         """Returns complete engine status with vibration simulation."""
         try:
             # Primary metrics
-            rpm = self._get_prop('RPM')
-            egt = self._get_prop('EGT_F')
-            cht = self._get_prop('CHT_F')
-            oil_temp = self._get_prop('OIL_TEMP_F')
-            oil_pressure = self._get_prop('OIL_PRESS_PSI')
-            fuel_flow = self._get_prop('FUEL_FLOW_GPH')
+            rpm, egt, cht, oil_temp, oil_pressure, fuel_flow = self._get_props()
             
             # Calculate vibration
             vibration = self._calculate_vibration(rpm, oil_temp, oil_pressure)
@@ -56,13 +80,7 @@ class EngineSystem:
                 'maintenance': self._get_maintenance_status(),
                 
                 # Operational limits
-                'limits': {
-                    'max_rpm': self.const.ENGINE['MAX_RPM'],
-                    'redline_rpm': self.const.ENGINE['REDLINE_RPM'],
-                    'max_egt': self.const.ENGINE['MAX_EGT'],
-                    'max_cht': 500,
-                    'max_vibration': 10.0
-                }
+                'limits': dict(ENGINE_LIMITS)
             }
             
         except Exception as e:
@@ -71,7 +89,7 @@ class EngineSystem:
     def _calculate_vibration(self, rpm: float, oil_temp: float, oil_pressure: float) -> float:
         """Simulates engine vibration based on operational parameters"""
         # Base vibration increases with RPM
-        rpm_factor = rpm / self.const.ENGINE['MAX_RPM']
+        rpm_factor = rpm / _MAX_RPM
         base_vibration = 0.5 + (rpm_factor * 4.0)
         
         # Oil temperature effect (higher temp = less viscosity = more vibration)
@@ -95,8 +113,10 @@ class EngineSystem:
         # Add random sensor noise
         vibration += random.uniform(-0.2, 0.2)
         
-        # Maintain within realistic limits
-        return max(0, min(10.0, vibration))
+        # Maintain within realistic limits; in-range values (the usual case) return without a builtin call
+        if 0 <= vibration <= 10.0:
+            return vibration
+        return 0 if vibration < 0 else 10.0
 
     def _check_status(
         self, rpm: float, egt: float, cht: float, 
@@ -115,9 +135,9 @@ class EngineSystem:
             return 'EXCESSIVE_VIBRATION'
             
         # Warning conditions
-        elif rpm > self.const.ENGINE['REDLINE_RPM']:
+        elif rpm > _REDLINE_RPM:
             return 'OVERSPEED'
-        elif egt > self.const.ENGINE['MAX_EGT']:
+        elif egt > _MAX_EGT:
             return 'EGT_OVERHEAT'
         elif oil_temp > 245:
             return 'OIL_OVERHEAT'
@@ -10,6 +10,12 @@ from ..exceptions import FlightSystemException
 class FlightSystem:
     """Monitors flight dynamics (position, orientation, speed)"""
 
+    # Property keys read on every update; their FGProps paths are resolved once per instance
+    PROP_KEYS = (
+        'LATITUDE', 'LONGITUDE', 'ALTITUDE_FT', 'ALTITUDE_AGL_FT', 'GROUND_ELEV_FT',
+        'PITCH_DEG', 'ROLL_DEG', 'HEADING_DEG', 'AIRSPEED_KT', 'VERTICAL_SPEED_FPS'
+    )
+
     def __init__(self, fg_connection):
         """
         Args:
@@ -17,6 +23,7 @@ class FlightSystem:
         """
         self.fg = fg_connection
         self.const = C172PConstants
+        self._prop_paths = {key: getattr(self.const.PROPERTIES.FLIGHT, key) for key in self.PROP_KEYS}
 
     def update(self) -> Dict[str, Any]:
         """Returns current flight state"""
@@ -62,7 +69,7 @@ class FlightSystem:
 
     def _get(self, key: str) -> float:
         """Fetches a flight property from FlightGear"""
-        prop_path = getattr(self.const.PROPERTIES.FLIGHT, key)
+        prop_path = self._prop_paths.get(key) or getattr(self.const.PROPERTIES.FLIGHT, key)
         response = self.fg.get(prop_path)
         if not response['success']:
             raise ValueError(f"Failed to read {key}: {response.get('message', 'No details')}")
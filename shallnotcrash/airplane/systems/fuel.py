@@ -1,8 +1,16 @@
 # shallnotcrash/airplane/systems/fuel.py
 
 import time
+from typing import Optional
 from ..constants import C172PConstants
 
+# Fuel limits are fixed for the airframe, so they are resolved once at import instead of per update
+_DENSITY_PPG = C172PConstants.FUEL['DENSITY_PPG']
+_USABLE_CAPACITY_GAL = C172PConstants.FUEL['USABLE_CAPACITY_GAL']
+_CRITICAL_THRESHOLD_GAL = C172PConstants.FUEL['CRITICAL_THRESHOLD_GAL']
+_WARNING_THRESHOLD_GAL = C172PConstants.FUEL['WARNING_THRESHOLD_GAL']
+_MAX_IMBALANCE_GAL = C172PConstants.FUEL['MAX_IMBALANCE_GAL']
+
 class FuelSystem:
     """Monitors C172P fuel state (2 tanks) with flow and endurance calculations"""
     
@@ -15,15 +23,22 @@ class FuelSystem:
         self.const = C172PConstants
         self.last_update = time.time()
         self.last_total_fuel = None
+        # Left/right tank quantity paths, indexed by tank_idx
+        self._tank_paths = (self.const.PROPERTIES.FUEL.LEFT_QTY_GAL, self.const.PROPERTIES.FUEL.RIGHT_QTY_GAL)
+        
+    def update(self, current_time: Optional[float] = None) -> dict:
+        """Returns current fuel state with status, flow, and endurance
         
-    def update(self) -> dict:
-        """Returns current fuel state with status, flow, and endurance"""
+        Args:
+            current_time: Sample timestamp already taken by the caller; read from the clock if omitted
+        """
         try:
             # Get current fuel quantities
             left_gal = self._get_tank_quantity(tank_idx=0)
             right_gal = self._get_tank_quantity(tank_idx=1)
             current_total = left_gal + right_gal
-            current_time = time.time()
+            if current_time is None:
+                current_time = time.time()
             
             # Initialize fuel flow and endurance
             fuel_flow_gph = 0.0
@@ -47,18 +62,18 @@ class FuelSystem:
                 'tanks': {
                     'left': {
                         'gallons': left_gal, 
-                        'lbs': left_gal * self.const.FUEL['DENSITY_PPG']
+                        'lbs': left_gal * _DENSITY_PPG
                     },
                     'right': {
                         'gallons': right_gal, 
-                        'lbs': right_gal * self.const.FUEL['DENSITY_PPG']
+                        'lbs': right_gal * _DENSITY_PPG
                     }
                 },
                 'total_gal': current_total,
                 'fuel_flow': fuel_flow_gph,
                 'endurance_min': endurance_min,
-                'status': self._check_status(left_gal, right_gal),
-                'is_usable': current_total <= self.const.FUEL['USABLE_CAPACITY_GAL']
+                'status': self._check_status(left_gal, right_gal, current_total),
+                'is_usable': current_total <= _USABLE_CAPACITY_GAL
             }
         except Exception as e:
             return {
@@ -68,25 +83,17 @@ class FuelSystem:
     
     def _get_tank_quantity(self, tank_idx: int) -> float:
         """Get quantity for tank 0 (left) or 1 (right)"""
-        prop = (
-            self.const.PROPERTIES.FUEL.LEFT_QTY_GAL 
-            if tank_idx == 0 
-            else self.const.PROPERTIES.FUEL.RIGHT_QTY_GAL
-        )
-        response = self.fg.get(prop)
+        response = self.fg.get(self._tank_paths[0 if tank_idx == 0 else 1])
         if not response['success']:
             raise ValueError(f"Failed to read tank {tank_idx}: {response['message']}")
         return float(response['data']['value'])
     
-    def _check_status(self, left_gal: float, right_gal: float) -> str:
-        """Determine fuel system health"""
-        total = left_gal + right_gal
-        imbalance = abs(left_gal - right_gal)
-        
-        if total < self.const.FUEL['CRITICAL_THRESHOLD_GAL']:
+    def _check_status(self, left_gal: float, right_gal: float, total: float) -> str:
+        """Determine fuel system health from the tank quantities and their precomputed total"""
+        if total < _CRITICAL_THRESHOLD_GAL:
             return 'CRITICAL'
-        elif total < self.const.FUEL['WARNING_THRESHOLD_GAL']:
+        elif total < _WARNING_THRESHOLD_GAL:
             return 'LOW_FUEL'
-        elif imbalance > self.const.FUEL['MAX_IMBALANCE_GAL']:
+        elif abs(left_gal - right_gal) > _MAX_IMBALANCE_GAL:
             return 'IMBALANCE'
         return 'NORMAL'
@@ -18,6 +18,11 @@ class TestEngineSystem(unittest.TestCase):
         self.engine_system = EngineSystem(self.mock_fg)
         self.default_response = {'success': True, 'data': {'value': 2000.0}}
         self.mock_fg.get.return_value = self.default_response
+        self.mock_fg.get_many.return_value = self._batch([2000.0] * 6)
+
+    @staticmethod
+    def _batch(values):
+        return {'success': True, 'data': {'values': values}}
 
     def test_engine_status_normal(self):
         result = self.engine_system.update()
@@ -30,14 +35,52 @@ class TestEngineSystem(unittest.TestCase):
                 return {'success': True, 'data': {'value': 0}}
             return self.default_response
         self.mock_fg.get.side_effect = side_effect
+        self.mock_fg.get_many.return_value = self._batch([0] + [2000.0] * 5)
         result = self.engine_system.update()
         self.assertEqual(result['status'], 'STOPPED')
 
     def test_engine_error(self):
         self.mock_fg.get.return_value = {'success': False, 'message': 'Sensor fail'}
+        self.mock_fg.get_many.return_value = {'success': False, 'message': 'Sensor fail'}
         result = self.engine_system.update()
         self.assertEqual(result['status'], 'ERROR')
         self.assertIn('error', result)
 
+    def test_batched_read_normal(self):
+        # RPM, EGT, CHT, oil temp, oil pressure, fuel flow in PROP_KEYS order
+        self.mock_fg.get_many.return_value = self._batch([2400.0, 1300.0, 380.0, 200.0, 50.0, 8.0])
+        result = self.engine_system.update()
+        self.assertEqual(result['rpm'], 2400.0)
+        self.assertEqual(result['fuel_flow'], 8.0)
+        self.assertEqual(result['status'], 'NORMAL')
+        self.mock_fg.get.assert_not_called()
+
+    def test_failed_batch_falls_back_to_single_reads(self):
+        self.mock_fg.get_many.return_value = {'success': False, 'message': 'Failed to read properties'}
+        self.mock_fg.get.return_value = {'success': True, 'data': {'value': 0}}
+        result = self.engine_system.update()
+        self.assertEqual(result['rpm'], 0.0)
+        self.assertEqual(result['status'], 'ENGINE_FAILURE')
+        self.assertEqual(self.mock_fg.get.call_count, len(EngineSystem.PROP_KEYS))
+
+    def test_short_batch_falls_back_to_single_reads(self):
+        self.mock_fg.get_many.return_value = self._batch([2400.0, 1300.0])
+        result = self.engine_system.update()
+        self.assertEqual(result['rpm'], 2000.0)
+        self.assertEqual(self.mock_fg.get.call_count, len(EngineSystem.PROP_KEYS))
+
+    def test_unparsed_slot_is_read_on_its_own(self):
+        self.mock_fg.get_many.return_value = self._batch([2400.0, None, 380.0, 200.0, 50.0, 8.0])
+        self.mock_fg.get.return_value = {'success': True, 'data': {'value': 1300.0}}
+        result = self.engine_system.update()
+        self.assertEqual(result['egt'], 1300.0)
+        self.assertEqual(result['status'], 'NORMAL')
+        self.mock_fg.get.assert_called_once()
+
+    def test_limits_are_not_shared_between_results(self):
+        first = self.engine_system.update()
+        first['limits']['max_rpm'] = 0
+        self.assertEqual(self.engine_system.update()['limits']['max_rpm'], 2700)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
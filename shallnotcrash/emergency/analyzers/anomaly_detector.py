@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from enum import IntEnum
 import time
 import logging
+from bisect import bisect_left
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +33,10 @@ class FlightPhase(IntEnum):
 class AnomalySeverity(IntEnum):
     NORMAL = 0; ADVISORY = 1; WARNING = 2; CRITICAL = 3; EMERGENCY = 4
 
-@dataclass
+# Severity indexed by how many ascending cut-offs a score exceeds
+_SEVERITY_BY_RANK = tuple(AnomalySeverity)
+
+@dataclass(slots=True)  # Built once per parameter per tick; no per-instance __dict__
 class AnomalyScore:
     parameter: str; value: float; baseline: float; deviation: float
     normalized_score: float; is_anomaly: bool; severity: AnomalySeverity
@@ -61,43 +65,50 @@ class AnomalyDetector:
             'rpm': 500, 'oil_pressure': 20, 'g_load': 1.5, 'airspeed': 30,
             'yaw_rate': 45, 'roll': 45, 'pitch': 30, 'fuel_flow': 5.0
         }
+        # Per-parameter (mean, std, z-score divisor, rate threshold, severity cut-offs), resolved
+        # once so detect() does a single lookup per value instead of five.
+        self._limits = {
+            param: (baseline["mean"], baseline["std"], max(baseline["std"], 0.01),
+                    self.change_rate_thresholds.get(param),
+                    self._severity_cutoffs(self.thresholds.get(param, 3.0)))
+            for param, baseline in self.baselines.items()
+        }
     
     def detect(self, telemetry: Dict[str, float], 
                flight_phase: FlightPhase = FlightPhase.CRUISE) -> Dict[str, AnomalyScore]:
         results = {}
-        current_timestamp = time.time()
+        current_timestamp = time.time()  # Captured once and shared by every score this tick
         
         for param, value in telemetry.items():
-            if param not in self.baselines:
+            limits = self._limits.get(param)
+            if limits is None:
                 continue
-            
-            baseline = self.baselines[param]
-            threshold = self.thresholds.get(param, 3.0)
+            mean, std, z_divisor, rate_threshold, cutoffs = limits
             
             # --- Score 1: Deviation from static baseline (Z-score) ---
-            z_score = abs(value - baseline["mean"]) / max(baseline["std"], 0.01)
+            z_score = abs(value - mean) / z_divisor
             
             # --- [NEW] Score 2: Rate of Change ---
             change_score = 0.0
-            if self.previous_telemetry and self.last_timestamp and param in self.change_rate_thresholds:
+            if self.previous_telemetry and self.last_timestamp and rate_threshold is not None:
                 delta_t = current_timestamp - self.last_timestamp
                 if delta_t > 1e-6: # Avoid division by zero
                     rate_of_change = abs(value - self.previous_telemetry.get(param, value)) / delta_t
                     # Score is how many times the rate of change exceeds its threshold
-                    change_score = rate_of_change / self.change_rate_thresholds[param]
+                    change_score = rate_of_change / rate_threshold
             
             # [MODIFIED] The final score is the HIGHER of the two scores.
             # This means either a steady out-of-bounds value OR a sudden,
             # rapid change can trigger an anomaly.
             final_score = max(z_score, change_score)
             
-            severity = self._score_to_severity(final_score, threshold)
+            severity = self._severity_for(final_score, cutoffs)
             
             results[param] = AnomalyScore(
-                parameter=param, value=value, baseline=baseline["mean"],
-                deviation=baseline["std"], normalized_score=final_score,
+                parameter=param, value=value, baseline=mean,
+                deviation=std, normalized_score=final_score,
                 is_anomaly=(severity != AnomalySeverity.NORMAL), severity=severity,
-                flight_phase=flight_phase
+                flight_phase=flight_phase, timestamp=current_timestamp
             )
 
         # [NEW] Update memory for the next cycle
@@ -106,12 +117,13 @@ class AnomalyDetector:
         
         return results
     
-    def _score_to_severity(self, score: float, threshold: float) -> AnomalySeverity:
-        if score > threshold * 2.0: return AnomalySeverity.EMERGENCY
-        elif score > threshold * 1.5: return AnomalySeverity.CRITICAL
-        elif score > threshold * 1.2: return AnomalySeverity.WARNING
-        elif score > threshold: return AnomalySeverity.ADVISORY
-        else: return AnomalySeverity.NORMAL
+    @staticmethod
+    def _severity_cutoffs(threshold: float) -> tuple:
+        """Ascending ADVISORY/WARNING/CRITICAL/EMERGENCY cut-offs; a score must exceed one to reach it."""
+        return (threshold, threshold * 1.2, threshold * 1.5, threshold * 2.0)
+
+    def _severity_for(self, score: float, cutoffs: tuple) -> AnomalySeverity:
+        return _SEVERITY_BY_RANK[bisect_left(cutoffs, score)]
 
 # [FIX] The global singleton instance has been removed to prevent state corruption.
 # The telemetry_worker in flightgear.py will now create its own private instance.
\ No newline at end of file
@@ -8,22 +8,20 @@ from dataclasses import dataclass
 from enum import IntEnum
 from typing import Dict, List, Tuple, Optional, Any
 from collections import deque, defaultdict
+from functools import lru_cache
 import numpy as np
 from scipy.stats import pearsonr, ConstantInputWarning
 import warnings
 
 # This import is necessary to have access to the AnomalyScore class for type checking
-try:
-    from .anomaly_detector import AnomalyScore, AnomalySeverity
-    from .. import constants
-except (ImportError, ModuleNotFoundError):
-    # Create placeholders if imports fail, ensuring script doesn't crash
-    class AnomalySeverity(IntEnum): NORMAL=0; ADVISORY=1; WARNING=2; CRITICAL=3; EMERGENCY=4
-    @dataclass
-    class AnomalyScore: value: float; severity: AnomalySeverity
-    class constants:
-        class DetectionParameters: CORRELATION_WINDOWS = {'long_term': 100}
-        class SystemWeights: ENGINE=1.0; FUEL=1.0; STRUCTURAL=1.0
+from .anomaly_detector import AnomalyScore, AnomalySeverity
+from .. import constants
+
+# Plain-int severities for the per-tick scoring path; IntEnum .value is a descriptor lookup
+_SEVERITY_NORMAL = int(AnomalySeverity.NORMAL)
+_SEVERITY_WARNING = int(AnomalySeverity.WARNING)
+_SEVERITY_CRITICAL = int(AnomalySeverity.CRITICAL)
+_SEVERITY_EMERGENCY = int(AnomalySeverity.EMERGENCY)
 
 class CorrelationLevel(IntEnum):
     """Correlation severity levels aligned with emergency protocols"""
@@ -33,7 +31,7 @@ class CorrelationLevel(IntEnum):
     STRONG = 3
     CRITICAL = 4
 
-@dataclass
+@dataclass(slots=True)
 class CorrelationDiagnostic:
     """Enhanced correlation analysis result container"""
     level: CorrelationLevel
@@ -45,6 +43,25 @@ class CorrelationDiagnostic:
     status_message: str = "Normal system correlations"
     structural_integrity: Optional[float] = None
 
+STATUS_MESSAGES = {
+    CorrelationLevel.CRITICAL: "CRITICAL CORRELATION in {}! Immediate inspection required",
+    CorrelationLevel.STRONG: "Strong correlations detected in {} - monitor closely",
+    CorrelationLevel.MODERATE: "Moderate system correlations present",
+    CorrelationLevel.WEAK: "Minor correlations observed",
+    CorrelationLevel.NONE: "Normal system correlations"
+}
+
+# (parameter, weight) pairs for the composite structural severity, summed in this order
+STRUCTURAL_SEVERITY_WEIGHTS = (
+    ('vibration', 0.4), ('control_asymmetry', 0.3), ('g_load', 0.2), ('structural_integrity', 0.1)
+)
+
+# Engine then structural parameter pairs checked for pairwise correlation
+PARAMETER_PAIRS = (
+    ('rpm', 'vibration'), ('oil_pressure', 'oil_temp'), ('cht', 'egt'),
+    ('control_asymmetry', 'aileron'), ('g_load', 'elevator'), ('vibration', 'structural_integrity')
+)
+
 class CorrelationAnalyzer:
     """C172P-specific correlation analysis with structural monitoring"""
     
@@ -55,45 +72,66 @@ class CorrelationAnalyzer:
             CorrelationLevel.MODERATE: 0.55, CorrelationLevel.WEAK: 0.40,
             CorrelationLevel.NONE: 0.0
         }
+        # Thresholds indexed by level value, and levels ordered strongest-first, for the scoring path
+        self._level_thresholds = tuple(self.CORRELATION_THRESHOLDS[level] for level in CorrelationLevel)
+        self._levels_desc = tuple(sorted(CorrelationLevel, key=self._level_thresholds.__getitem__, reverse=True))
+        # "sys1-sys2" key -> (i, j, sys1, sys2, weight sum) for each system pair; keys are formatted once
+        # and never split back apart
+        systems = list(self.SYSTEM_WEIGHTS)
+        self._system_pairs = {
+            f"{sys1}-{sys2}": (i, j, sys1, sys2, self.SYSTEM_WEIGHTS[sys1] + self.SYSTEM_WEIGHTS[sys2])
+            for i, sys1 in enumerate(systems) for j, sys2 in enumerate(systems) if j > i
+        }
         self.STRUCTURAL_PARAMS = ['vibration', 'control_asymmetry', 'g_load', 'structural_integrity']
         self.history = deque(maxlen=history_size)
-        self.system_severity = {system: deque(maxlen=history_size) for system in self.SYSTEM_WEIGHTS.keys()}
+        # One severity series per system, in SYSTEM_WEIGHTS order so _system_pairs indices line up
+        self._system_index = {name: i for i, name in enumerate(self.SYSTEM_WEIGHTS)}
+        self.system_severity = [deque(maxlen=history_size) for _ in self.SYSTEM_WEIGHTS]
+        self._engine_severity = self.system_severity[self._system_index['engine']]
+        self._fuel_severity = self.system_severity[self._system_index['fuel']]
+        self._structural_severity = self.system_severity[self._system_index['structural']]
+        # Per-entry integrity score (None when the entry has no structural data), aligned with history
+        self._integrity_scores = deque(maxlen=history_size)
 
     # --- [FIX] ROBUST HELPER FUNCTIONS ---
     def _get_severity(self, score_obj: Any) -> int:
         """Safely gets severity from an AnomalyScore object or a simple dict."""
-        if hasattr(score_obj, 'severity'): # Handles AnomalyScore objects
-            return score_obj.severity.value
+        if isinstance(score_obj, AnomalyScore): # Fast path: the detector's own scores, direct attribute access
+            return score_obj.severity # IntEnum already compares and sums as its int value
         if isinstance(score_obj, dict) and 'score' in score_obj: # Handles {'score': float} dicts
             score = score_obj['score']
-            if score > 0.9: return AnomalySeverity.EMERGENCY.value
-            if score > 0.7: return AnomalySeverity.CRITICAL.value
-            if score > 0.5: return AnomalySeverity.WARNING.value
-            return AnomalySeverity.NORMAL.value
-        return AnomalySeverity.NORMAL.value
+            if score > 0.9: return _SEVERITY_EMERGENCY
+            if score > 0.7: return _SEVERITY_CRITICAL
+            if score > 0.5: return _SEVERITY_WARNING
+            return _SEVERITY_NORMAL
+        severity = getattr(score_obj, 'severity', None) # Other score types exposing a severity
+        if severity is not None:
+            return int(getattr(severity, 'value', severity)) # Plain Enum severities only convert via .value
+        return _SEVERITY_NORMAL
 
     def _get_value(self, score_obj: Any) -> float:
         """Safely gets the raw telemetry value from an AnomalyScore object."""
         # The simulation doesn't provide this, so we fall back gracefully.
-        if hasattr(score_obj, 'value'):
+        if isinstance(score_obj, AnomalyScore):
             return float(score_obj.value)
-        return 0.0 # Return a neutral value if not available
+        value = getattr(score_obj, 'value', None)
+        return 0.0 if value is None else float(value) # Return a neutral value if not available
 
     def update_systems(self, engine_status: Dict, fuel_status: Dict, structural_status: Dict):
         """Update system states with C172P-specific diagnostics"""
         self.history.append({'engine': engine_status, 'fuel': fuel_status, 'structural': structural_status})
         
         # [FIX] Use the robust helper to get severity
-        self.system_severity['engine'].append(max((self._get_severity(s) for s in engine_status.values()), default=0))
-        self.system_severity['fuel'].append(max((self._get_severity(s) for s in fuel_status.values()), default=0))
-        self.system_severity['structural'].append(self._calculate_structural_severity(structural_status))
+        self._engine_severity.append(max((self._get_severity(s) for s in engine_status.values()), default=0))
+        self._fuel_severity.append(max((self._get_severity(s) for s in fuel_status.values()), default=0))
+        self._structural_severity.append(self._calculate_structural_severity(structural_status))
+        self._integrity_scores.append(self._score_structural_integrity(structural_status))
     
     def _calculate_structural_severity(self, status: Dict) -> float:
         """Compute composite structural severity score"""
         if not status: return 0.0
-        weights = {'vibration': 0.4, 'control_asymmetry': 0.3, 'g_load': 0.2, 'structural_integrity': 0.1}
         score = 0.0
-        for param, weight in weights.items():
+        for param, weight in STRUCTURAL_SEVERITY_WEIGHTS:
             if param in status:
                 # [FIX] Use the robust helper to get severity
                 score += weight * self._get_severity(status[param])
@@ -119,34 +157,29 @@ class CorrelationAnalyzer:
     def _calculate_system_correlations(self) -> Dict[str, float]:
         """Calculate weighted correlations between system severities"""
         correlations = {}
-        systems = list(self.SYSTEM_WEIGHTS.keys())
-        severity_data = {sys: list(self.system_severity[sys]) for sys in systems}
-        for i, sys1 in enumerate(systems):
-            for sys2 in systems[i+1:]:
-                series1, series2 = severity_data[sys1], severity_data[sys2]
-                min_length = min(len(series1), len(series2))
-                if min_length < 5:
-                    correlations[f"{sys1}-{sys2}"] = 0.0
-                    continue
-                try:
-                    # [THE FIX] This block now ignores the "ConstantInputWarning"
-                    with warnings.catch_warnings():
-                        warnings.simplefilter("ignore", ConstantInputWarning)
-                        corr, _ = pearsonr(series1[:min_length], series2[:min_length])
-                    
-                    weighted_corr = corr * (self.SYSTEM_WEIGHTS[sys1] + self.SYSTEM_WEIGHTS[sys2]) / 2
-                    correlations[f"{sys1}-{sys2}"] = max(0, weighted_corr) if not np.isnan(corr) else 0.0
-                except ValueError:
-                    correlations[f"{sys1}-{sys2}"] = 0.0
+        severity_data = [list(series) for series in self.system_severity]
+        for pair_key, (i, j, _, _, weight_sum) in self._system_pairs.items():
+            series1, series2 = severity_data[i], severity_data[j]
+            min_length = min(len(series1), len(series2))
+            if min_length < 5:
+                correlations[pair_key] = 0.0
+                continue
+            try:
+                # [THE FIX] This block now ignores the "ConstantInputWarning"
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", ConstantInputWarning)
+                    corr, _ = pearsonr(series1[:min_length], series2[:min_length])
+                
+                weighted_corr = corr * weight_sum / 2
+                correlations[pair_key] = max(0, weighted_corr) if not np.isnan(corr) else 0.0
+            except ValueError:
+                correlations[pair_key] = 0.0
         return correlations
     
     def _calculate_parameter_correlations(self) -> List[Tuple[str, str, float]]:
         """Calculate C172P-specific parameter correlations"""
         results = []
-        engine_pairs = [('rpm', 'vibration'), ('oil_pressure', 'oil_temp'), ('cht', 'egt')]
-        structural_pairs = [('control_asymmetry', 'aileron'), ('g_load', 'elevator'), ('vibration', 'structural_integrity')]
-        
-        for param1, param2 in engine_pairs + structural_pairs:
+        for param1, param2 in PARAMETER_PAIRS:
             vals1, vals2 = [], []
             for entry in self.history:
                 val1_obj = entry['engine'].get(param1) or entry['structural'].get(param1)
@@ -167,20 +200,22 @@ class CorrelationAnalyzer:
                     results.append((param1, param2, 0.0))
         return sorted(results, key=lambda x: x[2], reverse=True)
     
+    def _score_structural_integrity(self, struct: Dict) -> Optional[float]:
+        """Integrity score of a single history entry, or None if it carries no structural data"""
+        if not struct: return None
+        score, count = 0.0, 0
+        for param in self.STRUCTURAL_PARAMS:
+            if param in struct:
+                # [FIX] Use the robust helper to get severity
+                severity = self._get_severity(struct[param])
+                score += (4 - severity) / 4
+                count += 1
+        return score / count if count > 0 else None
+
     def _assess_structural_integrity(self) -> Optional[float]:
         """Compute composite structural integrity score"""
-        scores = []
-        for entry in self.history:
-            struct = entry['structural']
-            if not struct: continue
-            score, count = 0.0, 0
-            for param in self.STRUCTURAL_PARAMS:
-                if param in struct:
-                    # [FIX] Use the robust helper to get severity
-                    severity = self._get_severity(struct[param])
-                    score += (4 - severity) / 4
-                    count += 1
-            if count > 0: scores.append(score / count)
+        # Entries are scored once on arrival; the deque evicts them together with history
+        scores = [score for score in self._integrity_scores if score is not None]
         return np.mean(scores) if scores else None
 
     def _determine_overall_level(self, system_correlations: Dict[str, float], param_correlations: List[Tuple[str, str, float]]) -> Tuple[CorrelationLevel, float]:
@@ -188,18 +223,19 @@ class CorrelationAnalyzer:
         system_score = np.mean([corr for corr in system_correlations.values()]) if system_correlations else 0.0
         param_score = np.mean([corr for *_, corr in param_correlations]) if param_correlations else 0.0
         composite_score = 0.6 * system_score + 0.4 * param_score
-        for level, threshold in sorted(self.CORRELATION_THRESHOLDS.items(), key=lambda item: item[1], reverse=True):
-            if composite_score >= threshold: return (level, composite_score)
+        for level in self._levels_desc:
+            if composite_score >= self._level_thresholds[level]: return (level, composite_score)
         return (CorrelationLevel.NONE, composite_score)
 
     def _generate_recommendations(self, system_correlations: Dict[str, float], param_correlations: List[Tuple[str, str, float]]) -> List[str]:
         recommendations = []
+        strong = self._level_thresholds[CorrelationLevel.STRONG]
         for systems, corr in system_correlations.items():
-            if corr >= self.CORRELATION_THRESHOLDS[CorrelationLevel.STRONG]:
-                sys1, sys2 = systems.split('-')
+            if corr >= strong:
+                _, _, sys1, sys2, _ = self._system_pairs[systems]
                 recommendations.append(f"INSPECT: Strong correlation ({corr:.2f}) between {sys1.upper()} and {sys2.upper()} systems")
         for param1, param2, corr in param_correlations:
-            if corr >= self.CORRELATION_THRESHOLDS[CorrelationLevel.STRONG]:
+            if corr >= strong:
                 recommendations.append(f"CHECK: High correlation ({corr:.2f}) between {param1.upper()} and {param2.upper()}")
         return recommendations or ["No significant correlations detected"]
 
@@ -207,28 +243,33 @@ class CorrelationAnalyzer:
         if not system_correlations: return None
         system_scores = defaultdict(float)
         for systems, corr in system_correlations.items():
-            sys1, sys2 = systems.split('-')
-            weight = (self.SYSTEM_WEIGHTS.get(sys1, 1.0) + self.SYSTEM_WEIGHTS.get(sys2, 1.0)) / 2
+            _, _, sys1, sys2, weight_sum = self._system_pairs[systems]
+            weight = weight_sum / 2
             system_scores[sys1] += corr * weight
             system_scores[sys2] += corr * weight
         return max(system_scores.items(), key=lambda x: x[1])[0] if system_scores else None
 
     def _get_status_message(self, level: CorrelationLevel, dominant_system: Optional[str]) -> str:
-        dom_sys_str = dominant_system.upper() if dominant_system else "systems"
-        messages = {
-            CorrelationLevel.CRITICAL: f"CRITICAL CORRELATION in {dom_sys_str}! Immediate inspection required",
-            CorrelationLevel.STRONG: f"Strong correlations detected in {dom_sys_str} - monitor closely",
-            CorrelationLevel.MODERATE: "Moderate system correlations present",
-            CorrelationLevel.WEAK: "Minor correlations observed",
-            CorrelationLevel.NONE: "Normal system correlations"
-        }
-        return messages.get(level, "Correlation status unknown")
+        template = STATUS_MESSAGES.get(level)
+        if template is None: return "Correlation status unknown"
+        # Only the selected template is formatted; the others are never built.
+        return template.format(dominant_system.upper() if dominant_system else "systems")
 
     def _empty_diagnostic(self, message: str = "Insufficient data") -> CorrelationDiagnostic:
         return CorrelationDiagnostic(level=CorrelationLevel.NONE, confidence=0.0, correlated_systems={}, correlated_params=[], recommendations=[message], status_message=message)
 
-CORRELATION_ANALYZER = CorrelationAnalyzer()
+@lru_cache(maxsize=1)
+def _shared_analyzer() -> CorrelationAnalyzer:
+    """The module-wide analyzer, built on first use instead of at import."""
+    return CorrelationAnalyzer()
+
+def __getattr__(name):
+    # CORRELATION_ANALYZER stays importable by name (PEP 562) but is only constructed when requested
+    if name == 'CORRELATION_ANALYZER':
+        return _shared_analyzer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def analyze_system_correlations(engine_status: Dict, fuel_status: Dict, structural_status: Dict) -> CorrelationDiagnostic:
-    CORRELATION_ANALYZER.update_systems(engine_status, fuel_status, structural_status)
-    return CORRELATION_ANALYZER.analyze()
+    analyzer = _shared_analyzer()
+    analyzer.update_systems(engine_status, fuel_status, structural_status)
+    return analyzer.analyze()
@@ -4,9 +4,11 @@ import os
 import joblib
 import logging
 import time
+from bisect import bisect_right
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import IntEnum
+from sklearn.preprocessing import StandardScaler
 
 class EmergencyPattern(IntEnum):
     NORMAL = 0
@@ -18,17 +20,58 @@ class EmergencyPattern(IntEnum):
     SYSTEM_CASCADE = 6
     LOSS_OF_CONTROL = 7
 
+# Direct value -> member table for classifier outputs, avoiding the EmergencyPattern(value) call path
+_PATTERN_BY_VALUE = {p.value: p for p in EmergencyPattern}
+# Rule-based fallback: worst parameter -> pattern; anything else reads as engine degradation
+_RULE_PATTERN_BY_PARAM = {
+    'yaw_rate': EmergencyPattern.LOSS_OF_CONTROL, 'roll': EmergencyPattern.LOSS_OF_CONTROL,
+    'g_load': EmergencyPattern.LOSS_OF_CONTROL, 'fuel_flow': EmergencyPattern.FUEL_LEAK,
+}
+
 class PatternConfidence(IntEnum):
     LOW = 1; MEDIUM = 2; HIGH = 3; VERY_HIGH = 4
 
-@dataclass
+# Probability cut-offs (inclusive lower bounds) and the confidence each band maps to
+_CONF_THRESHOLDS = (0.5, 0.75, 0.9)
+_CONF_THRESHOLDS_ARRAY = np.array(_CONF_THRESHOLDS)
+_CONF_LEVELS = (PatternConfidence.LOW, PatternConfidence.MEDIUM, PatternConfidence.HIGH, PatternConfidence.VERY_HIGH)
+
+@dataclass(slots=True)  # Built on every prediction; no per-instance __dict__
 class PatternResult:
     pattern_type: EmergencyPattern; confidence: PatternConfidence; probability: float
     contributing_features: List[str]; timestamp: float = field(default_factory=time.time)
     recommended_action: str = "Monitor situation"
 
+# Built once at import; get_recommended_action is called for every emergency prediction.
+RECOMMENDED_ACTIONS = {
+    EmergencyPattern.NORMAL: "Continue normal operations.",
+    EmergencyPattern.ENGINE_DEGRADATION: "ENGINE EMERGENCY - Reduce power, monitor instruments, prepare for emergency landing.",
+    EmergencyPattern.FUEL_LEAK: "FUEL EMERGENCY - Switch tanks if available, land immediately.",
+    EmergencyPattern.STRUCTURAL_FATIGUE: "STRUCTURAL EMERGENCY - Reduce speed, avoid abrupt maneuvers, land IMMEDIATELY.",
+    EmergencyPattern.ELECTRICAL_FAILURE: "ELECTRICAL FAILURE - Check circuit breakers, load shed non-essential systems.",
+    EmergencyPattern.WEATHER_DISTRESS: "ADVERSE WEATHER - Deviate from current path, consider diversion.",
+    EmergencyPattern.SYSTEM_CASCADE: "MULTIPLE SYSTEM FAILURE - DECLARE EMERGENCY, land immediately at nearest airport.",
+    EmergencyPattern.LOSS_OF_CONTROL: "LOSS OF CONTROL - PARE: Power idle, Ailerons neutral, Rudder opposite, Elevator forward."
+}
+
+# Per-key telemetry normalization: feature = (value + offset) / divisor, capped at 1.0 when clipped
+FEATURE_SCALING = {
+    'rpm': (0.0, 2700.0, False), 'oil_pressure': (0.0, 100.0, False),
+    'oil_temp': (0.0, 300.0, False), 'cht': (0.0, 500.0, False),
+    'egt': (0.0, 1500.0, False), 'fuel_flow': (0.0, 15.0, False),
+    'g_load': (3.0, 6.0, False), 'vibration': (0.0, 1.0, True),
+    'bus_volts': (0.0, 30.0, False), 'control_asymmetry': (0.0, 5.0, True),
+    'airspeed': (0.0, 200.0, False), 'yaw_rate': (0.0, 180.0, False),
+    'roll': (0.0, 180.0, False), 'pitch': (0.0, 90.0, False)
+}
+
 class PatternRecognizer:
-    def __init__(self, model_path: Optional[str] = None):
+    def __init__(self, model_path: Optional[str] = None, model_artifact: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            model_path: joblib artifact to load when no preloaded artifact is given
+            model_artifact: already-loaded artifact dict, so callers can share one load
+        """
         self.telemetry_keys = [
             'rpm', 'oil_pressure', 'oil_temp', 'cht', 'egt', 'fuel_flow', 
             'g_load', 'vibration', 'bus_volts', 'control_asymmetry',
@@ -38,57 +81,93 @@ class PatternRecognizer:
         self.triage_classifier = None
         self.specialist_classifier = None
         self.is_trained = False
+        # Reused (1, n_features) row for per-tick inference; extract_features() still returns fresh arrays
+        self._feature_row = np.empty((1, 2 * len(self.telemetry_keys)), dtype=float)
+        # StandardScaler folded into x * _scale_inv + _scale_bias; None means fall back to scaler.transform
+        self._scale_inv = None
+        self._scale_bias = None
         
-        self.startup_time = time.time()
+        self.startup_time = time.monotonic()  # Only ever compared against time.monotonic() for grace periods
         self.STARTUP_GRACE_PERIOD = 15.0
         self.readings_count = 0
         # [NEW] Define the post-grace stabilization window (10 readings = ~5 seconds)
         self.STABILIZATION_READINGS = 10
         
-        if model_path and os.path.exists(model_path):
+        if model_artifact is not None:
+            self._apply_model_artifact(model_artifact)
+        elif model_path and os.path.exists(model_path):
             self._load_model_artifact(model_path)
         else:
             logging.warning(f"Model not found at {model_path}. Using rule-based fallback.")
 
     def _load_model_artifact(self, model_path: str):
         try:
-            model_artifact = joblib.load(model_path)
-            self.scaler = model_artifact.get('scaler')
-            self.triage_classifier = model_artifact.get('triage_classifier')
-            self.specialist_classifier = model_artifact.get('specialist_classifier')
-            if all([self.scaler, self.triage_classifier, self.specialist_classifier]):
-                self.is_trained = True
-                logging.info("Successfully loaded trained model artifact")
+            self._apply_model_artifact(joblib.load(model_path))
         except Exception as e:
             logging.error(f"Failed to load model from {model_path}: {e}")
 
+    def _apply_model_artifact(self, model_artifact: Dict[str, Any]):
+        self.scaler = model_artifact.get('scaler')
+        self.triage_classifier = model_artifact.get('triage_classifier')
+        self.specialist_classifier = model_artifact.get('specialist_classifier')
+        if all([self.scaler, self.triage_classifier, self.specialist_classifier]):
+            self.is_trained = True
+            self._freeze_scaler()
+            logging.info("Successfully loaded trained model artifact")
+
+    def _freeze_scaler(self):
+        """Precomputes the scaler's affine form so inference skips sklearn's validation and temporaries."""
+        # Only StandardScaler is (x - mean_) / scale_; any other scaler keeps using scaler.transform
+        if not isinstance(self.scaler, StandardScaler):
+            return
+        scale = self.scaler.scale_ if self.scaler.with_std else None
+        mean = self.scaler.mean_ if self.scaler.with_mean else None
+        n_features = self._feature_row.shape[1]
+        inv = np.ones(n_features) if scale is None else 1.0 / np.asarray(scale, dtype=float)
+        bias = np.zeros(n_features) if mean is None else -np.asarray(mean, dtype=float) * inv
+        if inv.shape == bias.shape == (n_features,):
+            self._scale_inv, self._scale_bias = inv, bias
+
     def extract_features(self, telemetry: Dict[str, float], anomaly_scores: Dict[str, Any]) -> np.ndarray:
-        features = []
-        for key in self.telemetry_keys:
-            value = telemetry.get(key, 0.0)
-            if key == 'rpm': features.append(value / 2700.0)
-            elif key == 'oil_pressure': features.append(value / 100.0)
-            elif key == 'oil_temp': features.append(value / 300.0)
-            elif key == 'cht': features.append(value / 500.0)
-            elif key == 'egt': features.append(value / 1500.0)
-            elif key == 'fuel_flow': features.append(value / 15.0)
-            elif key == 'g_load': features.append((value + 3.0) / 6.0)
-            elif key == 'vibration': features.append(min(value / 1.0, 1.0))
-            elif key == 'bus_volts': features.append(value / 30.0)
-            elif key == 'control_asymmetry': features.append(min(value / 5.0, 1.0))
-            elif key == 'airspeed': features.append(value / 200.0)
-            elif key == 'yaw_rate': features.append(value / 180.0)
-            elif key == 'roll': features.append(value / 180.0)
-            elif key == 'pitch': features.append(value / 90.0)
-            else: features.append(0.0)
+        features = np.empty(2 * len(self.telemetry_keys), dtype=float)
+        self._fill_features(telemetry, anomaly_scores, features)
+        return features
+
+    def extract_features_batch(self, telemetries: List[Dict[str, float]], anomaly_scores_list: List[Dict[str, Any]]) -> np.ndarray:
+        """Column-wise extract_features() over many frames; returns an (n_frames, n_features) array."""
+        n_frames, n_keys = len(telemetries), len(self.telemetry_keys)
+        features = np.zeros((n_frames, 2 * n_keys), dtype=float)
+        for j, key in enumerate(self.telemetry_keys):
+            scaling = FEATURE_SCALING.get(key)
+            if scaling is not None:  # Unscaled keys keep a zero telemetry column, as in _fill_features
+                offset, divisor, clip = scaling
+                column = np.fromiter((t.get(key, 0.0) for t in telemetries), dtype=float, count=n_frames)
+                column += offset
+                column /= divisor
+                if clip: np.minimum(column, 1.0, out=column)
+                features[:, j] = column
+            features[:, n_keys + j] = np.fromiter(
+                (getattr(scores.get(key), 'normalized_score', 0.0) for scores in anomaly_scores_list),
+                dtype=float, count=n_frames) / 5.0
+        return features
+
+    def _fill_features(self, telemetry: Dict[str, float], anomaly_scores: Dict[str, Any], out: np.ndarray):
+        """Writes the normalized telemetry values followed by the anomaly scores into `out` in place."""
+        n_keys = len(self.telemetry_keys)
+        for i, key in enumerate(self.telemetry_keys):
+            scaling = FEATURE_SCALING.get(key)
+            if scaling is None:
+                out[i] = 0.0
+                continue
+            offset, divisor, clip = scaling
+            value = (telemetry.get(key, 0.0) + offset) / divisor
+            out[i] = min(value, 1.0) if clip else value
         
-        for key in self.telemetry_keys:
+        for i, key in enumerate(self.telemetry_keys, start=n_keys):
             score_data = anomaly_scores.get(key)
             if hasattr(score_data, 'normalized_score'):
-                features.append(score_data.normalized_score / 5.0)
-            else: features.append(0.0)
-        
-        return np.array(features, dtype=float)
+                out[i] = score_data.normalized_score / 5.0
+            else: out[i] = 0.0
 
     def predict_pattern(self, telemetry: Dict[str, float], anomaly_scores: Dict[str, Any]) -> Optional[PatternResult]:
         self.readings_count += 1
@@ -121,22 +200,28 @@ class PatternRecognizer:
 
     def _ml_prediction(self, telemetry: Dict[str, float], anomaly_scores: Dict[str, Any]) -> Optional[PatternResult]:
         try:
-            features = self.extract_features(telemetry, anomaly_scores)
-            if features.shape[0] != self.scaler.n_features_in_:
-                 logging.error(f"Feature mismatch! Expected {self.scaler.n_features_in_}, got {features.shape[0]}.")
+            features = self._feature_row
+            if features.shape[1] != self.scaler.n_features_in_:
+                 logging.error(f"Feature mismatch! Expected {self.scaler.n_features_in_}, got {features.shape[1]}.")
                  return None
+            self._fill_features(telemetry, anomaly_scores, features[0])
             
-            features_scaled = self.scaler.transform(features.reshape(1, -1))
+            if self._scale_inv is not None:
+                features_scaled = features
+                np.multiply(features, self._scale_inv, out=features)
+                np.add(features, self._scale_bias, out=features)
+            else:
+                features_scaled = self.scaler.transform(features)
             
-            triage_pred = self.triage_classifier.predict(features_scaled)[0]
-            if triage_pred == 0:
-                prob = self.triage_classifier.predict_proba(features_scaled)[0][0]
-                return PatternResult(pattern_type=EmergencyPattern.NORMAL, confidence=PatternConfidence.HIGH, probability=float(prob), contributing_features=[])
+            # One predict_proba per stage; argmax over it is what predict() would return
+            triage_probs = self.triage_classifier.predict_proba(features_scaled)[0]
+            if self.triage_classifier.classes_[triage_probs.argmax()] == 0:
+                return PatternResult(pattern_type=EmergencyPattern.NORMAL, confidence=PatternConfidence.HIGH, probability=float(triage_probs[0]), contributing_features=[])
             
-            specialist_pred = self.specialist_classifier.predict(features_scaled)[0]
             specialist_probs = self.specialist_classifier.predict_proba(features_scaled)[0]
-            confidence_score = np.max(specialist_probs)
-            pattern_type = EmergencyPattern(specialist_pred)
+            best = specialist_probs.argmax()
+            confidence_score = specialist_probs[best]
+            pattern_type = _PATTERN_BY_VALUE[self.specialist_classifier.classes_[best]]
             
             return PatternResult(
                 pattern_type=pattern_type,
@@ -149,6 +234,54 @@ class PatternRecognizer:
             logging.error(f"Error in ML prediction: {e}", exc_info=True)
             return None
 
+    def predict_batch(self, telemetries: List[Dict[str, float]], anomaly_scores_list: List[Dict[str, Any]]) -> List[Optional[PatternResult]]:
+        """
+        Runs the two-stage model over many frames with one scaler and classifier call per stage.
+        Intended for replay and evaluation: frames are independent, so the readings count and
+        post-grace stabilization window used by predict_pattern() do not apply.
+        """
+        if not self.is_trained:
+            return [self._rule_based_prediction(scores) for scores in anomaly_scores_list]
+        
+        n_frames = len(telemetries)
+        features = np.empty((n_frames, self._feature_row.shape[1]), dtype=float)
+        if features.shape[1] != self.scaler.n_features_in_:
+            logging.error(f"Feature mismatch! Expected {self.scaler.n_features_in_}, got {features.shape[1]}.")
+            return [None] * n_frames
+        for row, telemetry, scores in zip(features, telemetries, anomaly_scores_list):
+            self._fill_features(telemetry, scores, row)
+        
+        if self._scale_inv is not None:
+            features_scaled = features
+            np.multiply(features, self._scale_inv, out=features)
+            np.add(features, self._scale_bias, out=features)
+        else:
+            features_scaled = self.scaler.transform(features)
+        
+        results: List[Optional[PatternResult]] = [None] * n_frames
+        triage_probs = self.triage_classifier.predict_proba(features_scaled)
+        triage_preds = self.triage_classifier.classes_[triage_probs.argmax(axis=1)]
+        for i in np.flatnonzero(triage_preds == 0):
+            results[i] = PatternResult(pattern_type=EmergencyPattern.NORMAL, confidence=PatternConfidence.HIGH,
+                                       probability=float(triage_probs[i, 0]), contributing_features=[])
+        
+        abnormal = np.flatnonzero(triage_preds != 0)
+        if abnormal.size:
+            specialist_probs = self.specialist_classifier.predict_proba(features_scaled[abnormal])
+            best = specialist_probs.argmax(axis=1)
+            best_probs = specialist_probs[np.arange(abnormal.size), best]
+            confidences = self._get_confidences(best_probs)
+            for i, k, confidence_score, confidence in zip(abnormal, best, best_probs, confidences):
+                pattern_type = _PATTERN_BY_VALUE[self.specialist_classifier.classes_[k]]
+                results[i] = PatternResult(
+                    pattern_type=pattern_type,
+                    confidence=confidence,
+                    probability=float(confidence_score),
+                    contributing_features=[],
+                    recommended_action=self.get_recommended_action(pattern_type)
+                )
+        return results
+
     def _rule_based_prediction(self, anomaly_scores: Dict[str, Any]) -> PatternResult:
         # ... (no changes in this fallback function) ...
         max_score, worst_param = 0, ""
@@ -157,29 +290,16 @@ class PatternRecognizer:
                 max_score, worst_param = score_obj.normalized_score, param
         if max_score < 5.0:
             return PatternResult(pattern_type=EmergencyPattern.NORMAL, confidence=PatternConfidence.HIGH, probability=0.9, contributing_features=[])
-        pattern = EmergencyPattern.ENGINE_DEGRADATION
-        if worst_param in ('yaw_rate', 'roll', 'g_load'): pattern = EmergencyPattern.LOSS_OF_CONTROL
-        elif worst_param == 'fuel_flow': pattern = EmergencyPattern.FUEL_LEAK
+        pattern = _RULE_PATTERN_BY_PARAM.get(worst_param, EmergencyPattern.ENGINE_DEGRADATION)
         return PatternResult(pattern_type=pattern, confidence=PatternConfidence.MEDIUM, probability=0.75, contributing_features=[worst_param], recommended_action=self.get_recommended_action(pattern))
 
     def _get_confidence(self, probability: float) -> PatternConfidence:
-        # ... (no changes) ...
-        if probability >= 0.9: return PatternConfidence.VERY_HIGH
-        if probability >= 0.75: return PatternConfidence.HIGH
-        if probability >= 0.5: return PatternConfidence.MEDIUM
-        return PatternConfidence.LOW
+        return _CONF_LEVELS[bisect_right(_CONF_THRESHOLDS, probability)]
+
+    def _get_confidences(self, probabilities: np.ndarray) -> List[PatternConfidence]:
+        """Vectorized _get_confidence for a whole array of probabilities."""
+        return [_CONF_LEVELS[i] for i in np.searchsorted(_CONF_THRESHOLDS_ARRAY, probabilities, side='right')]
 
     def get_recommended_action(self, pattern: EmergencyPattern) -> str:
-        # ... (no changes) ...
-        actions = {
-            EmergencyPattern.NORMAL: "Continue normal operations.",
-            EmergencyPattern.ENGINE_DEGRADATION: "ENGINE EMERGENCY - Reduce power, monitor instruments, prepare for emergency landing.",
-            EmergencyPattern.FUEL_LEAK: "FUEL EMERGENCY - Switch tanks if available, land immediately.",
-            EmergencyPattern.STRUCTURAL_FATIGUE: "STRUCTURAL EMERGENCY - Reduce speed, avoid abrupt maneuvers, land IMMEDIATELY.",
-            EmergencyPattern.ELECTRICAL_FAILURE: "ELECTRICAL FAILURE - Check circuit breakers, load shed non-essential systems.",
-            EmergencyPattern.WEATHER_DISTRESS: "ADVERSE WEATHER - Deviate from current path, consider diversion.",
-            EmergencyPattern.SYSTEM_CASCADE: "MULTIPLE SYSTEM FAILURE - DECLARE EMERGENCY, land immediately at nearest airport.",
-            EmergencyPattern.LOSS_OF_CONTROL: "LOSS OF CONTROL - PARE: Power idle, Ailerons neutral, Rudder opposite, Elevator forward."
-        }
-        return actions.get(pattern, "Monitor situation and maintain aircraft control.")
+        return RECOMMENDED_ACTIONS.get(pattern, "Monitor situation and maintain aircraft control.")
     
\ No newline at end of file
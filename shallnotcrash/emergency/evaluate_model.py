@@ -53,9 +53,9 @@ def main():
     eval_data = generate_training_data(NUM_EVAL_SAMPLES, seed=EVAL_SEED)
     
     feature_extractor = PatternRecognizer()
-    features_list = [feature_extractor.extract_features(s['telemetry'], s['anomaly_scores']) for s in eval_data]
-    
-    X_eval = np.array(features_list)
+    X_eval = feature_extractor.extract_features_batch(
+        [s['telemetry'] for s in eval_data], [s['anomaly_scores'] for s in eval_data]
+    )
     y_true = np.array([s['pattern_label'] for s in eval_data])
 
     # --- 3. Prepare Data and Make Predictions ---
@@ -67,28 +67,12 @@ def main():
     triage_preds = triage_classifier.predict(X_eval_scaled)
     
     # Stage 2: Specialist predictions
-    final_preds = np.copy(triage_preds) # Start with triage results
-    # Find which samples were flagged as ABNORMAL (1)
-    abnormal_indices = np.where(triage_preds == 1)[0]
-    
-    if len(abnormal_indices) > 0:
-        # Get the features for only the abnormal samples
-        X_abnormal = X_eval_scaled[abnormal_indices]
-        # Predict the specific emergency for these samples
-        specialist_preds = specialist_classifier.predict(X_abnormal)
-        # Place the specialist predictions back into our final prediction array
-        # The triage model predicts 0 for NORMAL, while the specialist predicts specific emergency values (2, 3, etc.)
-        # To get the final label, we need to map the triage '1' (ABNORMAL) to the actual emergency value.
-        # However, for simplicity in evaluation, we will just use the specialist predictions directly.
-        
-        # A simple way to combine: if triage says normal, it's normal. If abnormal, use specialist.
-        # First, convert triage predictions from 0/1 to the actual enum values
-        y_pred = np.array([EmergencyPattern.NORMAL.value] * len(y_true))
-        specialist_preds = specialist_classifier.predict(X_eval_scaled[abnormal_indices])
-        y_pred[abnormal_indices] = specialist_preds
-
-    else:
-        y_pred = np.array([EmergencyPattern.NORMAL.value] * len(y_true))
+    # If triage says NORMAL the final label is NORMAL; samples flagged ABNORMAL (1) take the
+    # specialist's specific emergency value. The specialist runs once, on the abnormal rows only.
+    y_pred = np.full(len(y_true), EmergencyPattern.NORMAL.value, dtype=np.int64)
+    abnormal_indices = np.flatnonzero(triage_preds == 1)
+    if abnormal_indices.size:
+        y_pred[abnormal_indices] = specialist_classifier.predict(X_eval_scaled[abnormal_indices])
 
 
     # --- 4. Calculate and Print Metrics ---
@@ -0,0 +1,15 @@
+# emergency/tests/test_anomaly_detector.py
+from shallnotcrash.emergency.analyzers.anomaly_detector import AnomalyDetector, AnomalySeverity
+
+def test_scores_share_one_timestamp():
+    """Every score from one detect() call carries the same tick timestamp"""
+    detector = AnomalyDetector()
+    scores = detector.detect({'rpm': 2300.0, 'oil_pressure': 60.0, 'cht': 380.0})
+    assert len({score.timestamp for score in scores.values()}) == 1
+    assert detector.last_timestamp == scores['rpm'].timestamp
+
+def test_out_of_range_value_is_flagged():
+    """A value far from its baseline is reported as an anomaly"""
+    scores = AnomalyDetector().detect({'rpm': 500.0})
+    assert scores['rpm'].is_anomaly
+    assert scores['rpm'].severity == AnomalySeverity.EMERGENCY
@@ -0,0 +1,85 @@
+# emergency/tests/test_correlation_analyzer.py
+from enum import Enum
+from types import SimpleNamespace
+
+from shallnotcrash.emergency.analyzers.anomaly_detector import (
+    AnomalyScore,
+    AnomalySeverity,
+    FlightPhase
+)
+from shallnotcrash.emergency.analyzers.correlation_analyzer import CorrelationAnalyzer, CorrelationLevel
+
+def _score(value: float, severity: AnomalySeverity) -> AnomalyScore:
+    return AnomalyScore(parameter='rpm', value=value, baseline=2300.0, deviation=100.0,
+                        normalized_score=1.0, is_anomaly=severity != AnomalySeverity.NORMAL,
+                        severity=severity, flight_phase=FlightPhase.CRUISE)
+
+def test_severity_from_anomaly_score():
+    """AnomalyScore objects report their own severity"""
+    analyzer = CorrelationAnalyzer()
+    assert analyzer._get_severity(_score(1800.0, AnomalySeverity.CRITICAL)) == AnomalySeverity.CRITICAL
+
+def test_severity_from_score_dict():
+    """Simple {'score': float} dicts are bucketed by score"""
+    analyzer = CorrelationAnalyzer()
+    assert analyzer._get_severity({'score': 0.95}) == AnomalySeverity.EMERGENCY
+    assert analyzer._get_severity({'score': 0.6}) == AnomalySeverity.WARNING
+    assert analyzer._get_severity({'score': 0.1}) == AnomalySeverity.NORMAL
+
+class _PlainSeverity(Enum):
+    WARNING = 2
+
+def test_severity_from_other_score_types():
+    """Score objects with a plain Enum or int severity are read through their value"""
+    analyzer = CorrelationAnalyzer()
+    assert analyzer._get_severity(SimpleNamespace(severity=_PlainSeverity.WARNING)) == 2
+    assert analyzer._get_severity(SimpleNamespace(severity=3)) == 3
+
+def test_severity_and_value_fallbacks():
+    """Unknown inputs fall back to neutral values"""
+    analyzer = CorrelationAnalyzer()
+    assert analyzer._get_severity(None) == AnomalySeverity.NORMAL
+    assert analyzer._get_value({'score': 0.5}) == 0.0
+    assert analyzer._get_value(_score(1800.0, AnomalySeverity.WARNING)) == 1800.0
+
+def test_analyze_results_do_not_share_containers():
+    """Mutating one analyze() result does not leak into later cached results"""
+    analyzer = CorrelationAnalyzer()
+    for _ in range(12):
+        analyzer.update_systems({'rpm': {'score': 0.6}}, {'fuel_flow': {'score': 0.1}}, {})
+    first = analyzer.analyze()
+    expected = analyzer.analyze()
+    first.recommendations.append("tampered")
+    first.correlated_systems['engine-fuel'] = 99.0
+    first.correlated_params.clear()
+    assert analyzer.analyze() == expected
+
+def test_status_message_names_dominant_system():
+    """Status messages only name a system for strong and critical levels"""
+    analyzer = CorrelationAnalyzer()
+    assert analyzer._get_status_message(CorrelationLevel.CRITICAL, 'engine') == \
+        "CRITICAL CORRELATION in ENGINE! Immediate inspection required"
+    assert analyzer._get_status_message(CorrelationLevel.STRONG, None) == \
+        "Strong correlations detected in systems - monitor closely"
+    assert analyzer._get_status_message(CorrelationLevel.NONE, 'fuel') == "Normal system correlations"
+
+def test_structural_integrity_follows_history_window():
+    """Integrity only reflects entries still inside the history window"""
+    analyzer = CorrelationAnalyzer(history_size=3)
+    analyzer.update_systems({}, {}, {'vibration': {'score': 0.95}})
+    assert analyzer._assess_structural_integrity() == 0.0
+    for _ in range(3):
+        analyzer.update_systems({}, {}, {'vibration': {'score': 0.1}})
+    assert analyzer._assess_structural_integrity() == 1.0
+    for _ in range(3):
+        analyzer.update_systems({}, {}, {})
+    assert analyzer._assess_structural_integrity() is None
+
+def test_severity_series_follow_system_pair_indices():
+    """Each system's severity series sits at the index _system_pairs uses for it"""
+    analyzer = CorrelationAnalyzer()
+    analyzer.update_systems({'rpm': {'score': 0.95}}, {'fuel_flow': {'score': 0.6}}, {})
+    for i, j, sys1, sys2, _ in analyzer._system_pairs.values():
+        expected = {'engine': AnomalySeverity.EMERGENCY, 'fuel': AnomalySeverity.WARNING, 'structural': 0.0}
+        assert analyzer.system_severity[i][-1] == expected[sys1]
+        assert analyzer.system_severity[j][-1] == expected[sys2]
@@ -0,0 +1,82 @@
+# emergency/tests/test_pattern_recognizer.py
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sklearn.preprocessing import MinMaxScaler, StandardScaler
+
+from shallnotcrash.emergency.analyzers.anomaly_detector import (
+    AnomalyDetector, AnomalyScore, AnomalySeverity, FlightPhase
+)
+from shallnotcrash.emergency.analyzers.pattern_recognizer import PatternRecognizer, EmergencyPattern
+
+MODEL_PATH = Path(__file__).resolve().parents[3] / "models" / "c172p_emergency_model_improved.joblib"
+
+def _frames():
+    detector = AnomalyDetector()
+    telemetries = [
+        {'rpm': 2300.0, 'oil_pressure': 60.0, 'cht': 380.0, 'fuel_flow': 9.5},
+        {'rpm': 900.0, 'oil_pressure': 12.0, 'cht': 520.0, 'fuel_flow': 2.0},
+        {'roll': 80.0, 'yaw_rate': 60.0, 'g_load': 3.5, 'airspeed': 60.0},
+    ]
+    return telemetries, [detector.detect(t) for t in telemetries]
+
+def _summary(result):
+    return (result.pattern_type, result.confidence, result.probability, result.recommended_action)
+
+def test_rule_based_batch_matches_single_frames():
+    """Without a model, predict_batch applies the rule-based fallback per frame"""
+    recognizer = PatternRecognizer()
+    telemetries, scores = _frames()
+    batch = recognizer.predict_batch(telemetries, scores)
+    assert [_summary(r) for r in batch] == [_summary(recognizer._rule_based_prediction(s)) for s in scores]
+    assert batch[0].pattern_type == EmergencyPattern.NORMAL
+
+@pytest.mark.skipif(not MODEL_PATH.exists(), reason="trained model artifact not available")
+def test_model_batch_matches_single_frames():
+    """Batched inference gives the same results as one-frame-at-a-time inference"""
+    recognizer = PatternRecognizer(str(MODEL_PATH))
+    telemetries, scores = _frames()
+    batch = recognizer.predict_batch(telemetries, scores)
+    singles = [recognizer._ml_prediction(t, s) for t, s in zip(telemetries, scores)]
+    assert [_summary(r) for r in batch] == [_summary(r) for r in singles]
+
+def test_batch_features_match_single_frame_extraction():
+    """extract_features_batch stacks exactly what extract_features returns per frame"""
+    recognizer = PatternRecognizer()
+    telemetries, scores = _frames()
+    batch = recognizer.extract_features_batch(telemetries, scores)
+    for row, telemetry, frame_scores in zip(batch, telemetries, scores):
+        assert list(row) == list(recognizer.extract_features(telemetry, frame_scores))
+
+def test_batch_features_keep_scores_for_unscaled_keys():
+    """A key without FEATURE_SCALING still contributes its anomaly-score column in batch extraction"""
+    recognizer = PatternRecognizer()
+    recognizer.telemetry_keys = recognizer.telemetry_keys + ['manifold_pressure']
+    recognizer._feature_row = np.empty((1, 2 * len(recognizer.telemetry_keys)), dtype=float)
+    telemetry = {'rpm': 2300.0, 'manifold_pressure': 24.0}
+    scores = {'manifold_pressure': AnomalyScore(
+        parameter='manifold_pressure', value=24.0, baseline=22.0, deviation=1.0, normalized_score=2.5,
+        is_anomaly=True, severity=AnomalySeverity.WARNING, flight_phase=FlightPhase.CRUISE)}
+    batch = recognizer.extract_features_batch([telemetry], [scores])
+    assert list(batch[0]) == list(recognizer.extract_features(telemetry, scores))
+    assert batch[0][-1] == 0.5
+
+def _recognizer_with_scaler(scaler):
+    recognizer = PatternRecognizer()
+    features = np.random.default_rng(0).normal(size=(20, recognizer._feature_row.shape[1]))
+    recognizer._apply_model_artifact({'scaler': scaler.fit(features),
+                                      'triage_classifier': object(), 'specialist_classifier': object()})
+    return recognizer, features
+
+@pytest.mark.parametrize("scaler", [StandardScaler(), StandardScaler(with_mean=False)])
+def test_standard_scaler_is_folded(scaler):
+    """A StandardScaler is folded into an affine transform that matches scaler.transform"""
+    recognizer, features = _recognizer_with_scaler(scaler)
+    assert recognizer._scale_inv is not None
+    np.testing.assert_allclose(features * recognizer._scale_inv + recognizer._scale_bias, scaler.transform(features))
+
+def test_other_scalers_are_not_folded():
+    """Scalers with a different transform keep going through scaler.transform"""
+    recognizer, _ = _recognizer_with_scaler(MinMaxScaler())
+    assert recognizer._scale_inv is None and recognizer._scale_bias is None
@@ -0,0 +1,20 @@
+# emergency/tests/test_utilities.py
+import warnings
+
+from shallnotcrash.emergency import utilities
+from shallnotcrash.emergency.analyzers.anomaly_detector import AnomalyDetector
+from shallnotcrash.emergency.analyzers.pattern_recognizer import EmergencyPattern
+
+def test_recognize_patterns_is_exported():
+    """recognize_patterns classifies a frame through the shared engine"""
+    assert 'recognize_patterns' in utilities.__all__
+    telemetry = {'rpm': 900.0, 'oil_pressure': 12.0, 'cht': 520.0}
+    result = utilities.recognize_patterns(telemetry, AnomalyDetector().detect(telemetry))
+    assert result.pattern_type == EmergencyPattern.ENGINE_DEGRADATION
+
+def test_package_installs_warning_filters():
+    """Importing utilities keeps the package's UserWarning/FutureWarning filters"""
+    utilities._initialize_package()
+    installed = {(action, category) for action, _, category, _, _ in warnings.filters}
+    assert ('ignore', UserWarning) in installed
+    assert ('ignore', FutureWarning) in installed
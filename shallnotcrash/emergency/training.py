@@ -42,9 +42,10 @@ def main():
     
     logging.info("Extracting features from raw data...")
     feature_extractor = PatternRecognizer() 
-    features_list = [feature_extractor.extract_features(s['telemetry'], s['anomaly_scores']) for s in training_data]
-    labels = [s['pattern_label'] for s in training_data]
-    X, y = np.array(features_list), np.array(labels)
+    X = feature_extractor.extract_features_batch(
+        [s['telemetry'] for s in training_data], [s['anomaly_scores'] for s in training_data]
+    )
+    y = np.array([s['pattern_label'] for s in training_data])
     
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
     
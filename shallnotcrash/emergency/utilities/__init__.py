@@ -21,8 +21,8 @@ __version__ = "1.0.0"
 __author__ = "Aircraft Emergency Detection System"
 __description__ = "ML-based emergency pattern recognition for aircraft telemetry"
 
-# Core pattern types and data models
-from .pattern_recognition.pr1_pattern_types import (
+# Everything is defined once in the pattern_recognition package and re-exported here
+from .pattern_recognition import (
     EmergencyPattern,
     PatternConfidence,
     AnomalySeverity,
@@ -30,27 +30,16 @@ from .pattern_recognition.pr1_pattern_types import (
     PatternResult,
     TelemetryData,
     EMERGENCY_SIGNATURES,
-    get_pattern_action
-)
-
-# Feature extraction
-from .pattern_recognition.pr2_feature_extractor import FeatureExtractor
-
-# ML models
-from .pattern_recognition.pr3_ml_models import MLModelManager
-
-# Pattern analysis
-from .pattern_recognition.pr4_pattern_analyzer import PatternAnalyzer
-
-# Pattern recognition engine (fixed name)
-from .pattern_recognizer import recognize_patterns
-
-# Training utilities
-from .pattern_recognition.train_emergency_detector import (
-    generate_training_data,
-    train_and_evaluate_model,
-    visualize_data_characteristics
+    get_pattern_action,
+    FeatureExtractor,
+    PatternAnalyzer,
+    create_emergency_detector,
+    get_pattern_info,
+    is_critical_pattern,
+    check_dependencies
 )
+from . import pattern_recognition as _pattern_recognition
+from functools import lru_cache
 
 # Public API
 __all__ = [
@@ -69,91 +58,42 @@ __all__ = [
     'generate_training_data',
     'train_and_evaluate_model',
     'visualize_data_characteristics',
+    'create_emergency_detector',
+    'get_pattern_info',
+    'is_critical_pattern',
+    'check_dependencies',
     '__version__',
     '__author__',
     '__description__'
 ]
 
-# Optional helpers
-def create_emergency_detector():
-    """
-    Factory function to create a complete emergency detection system.
-    
-    Returns:
-        tuple: (feature_extractor, ml_manager, pattern_analyzer)
-    """
-    feature_extractor = FeatureExtractor(window_size=30)
-    ml_manager = MLModelManager()
-    pattern_analyzer = PatternAnalyzer()
-    return feature_extractor, ml_manager, pattern_analyzer
+@lru_cache(maxsize=1)
+def _shared_recognizer():
+    # Built on first use so importing utilities does not construct the engine
+    from ..analyzers.pattern_recognizer import PatternRecognizer
+    return PatternRecognizer()
 
-def get_pattern_info(pattern: EmergencyPattern) -> dict:
+# Pattern recognition engine
+def recognize_patterns(telemetry, anomaly_scores):
     """
-    Get detailed information about a specific emergency pattern.
-    
-    Args:
-        pattern: The emergency pattern to get info for
-        
-    Returns:
-        dict: Pattern information including features, thresholds, and actions
-    """
-    return EMERGENCY_SIGNATURES.get(pattern, {})
+    Classify one telemetry frame with the shared pattern recognition engine.
 
-def is_critical_pattern(pattern: EmergencyPattern) -> bool:
-    """
-    Check if a pattern represents a critical emergency.
-    
     Args:
-        pattern: The emergency pattern to check
-        
+        telemetry: Raw telemetry values keyed by parameter name
+        anomaly_scores: Anomaly scores for the same frame
+
     Returns:
-        bool: True if pattern is critical, False otherwise
+        PatternResult: The recognized pattern, or None if no prediction could be made
     """
-    critical_patterns = {
-        EmergencyPattern.FUEL_LEAK,
-        EmergencyPattern.STRUCTURAL_FATIGUE,
-        EmergencyPattern.ELECTRICAL_FAILURE,
-        EmergencyPattern.SYSTEM_CASCADE,
-        EmergencyPattern.UNKNOWN_EMERGENCY
-    }
-    return pattern in critical_patterns
-
-__all__.extend([
-    'create_emergency_detector',
-    'get_pattern_info',
-    'is_critical_pattern'
-])
-
-def check_dependencies():
-    """Check if required dependencies are available."""
-    deps = {}
-    try:
-        import numpy
-        deps['numpy'] = numpy.__version__
-    except ImportError:
-        deps['numpy'] = 'Not available'
-
-    try:
-        import sklearn
-        deps['sklearn'] = sklearn.__version__
-    except ImportError:
-        deps['sklearn'] = 'Not available'
-
-    try:
-        import pandas
-        deps['pandas'] = pandas.__version__
-    except ImportError:
-        deps['pandas'] = 'Not available'
-
-    try:
-        import matplotlib
-        deps['matplotlib'] = matplotlib.__version__
-    except ImportError:
-        deps['matplotlib'] = 'Not available'
-
-    return deps
-
-__all__.append('check_dependencies')
+    return _shared_recognizer().predict_pattern(telemetry, anomaly_scores)
+
+def __getattr__(name):
+    # ML and training names stay lazy; resolve them through the subpackage on first use
+    if name in _pattern_recognition._LAZY_IMPORTS:
+        value = getattr(_pattern_recognition, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def _initialize_package():
     """Initialize package-level settings and configurations."""
@@ -24,6 +24,8 @@ __version__ = "1.0.0"
 __author__ = "Aircraft Emergency Detection System"
 __description__ = "ML-based emergency pattern recognition for aircraft telemetry"
 
+import importlib
+
 # Core pattern types and data models
 from .pr1_pattern_types import (
     # Enums
@@ -44,18 +46,25 @@ from .pr1_pattern_types import (
 # Feature extraction
 from .pr2_feature_extractor import FeatureExtractor
 
-# ML models
-from .pr3_ml_models import MLModelManager
-
 # Pattern analysis
 from .pr4_pattern_analyzer import PatternAnalyzer
 
-# Training utilities
-from .train_emergency_detector import (
-    generate_training_data,
-    train_and_evaluate_model,
-    visualize_data_characteristics
-)
+# ML models and training utilities pull in sklearn/matplotlib, so they are
+# imported on first attribute access (PEP 562) rather than with the package
+_LAZY_IMPORTS = {
+    'MLModelManager': '.pr3_ml_models',
+    'generate_training_data': '.train_emergency_detector',
+    'train_and_evaluate_model': '.train_emergency_detector',
+    'visualize_data_characteristics': '.train_emergency_detector'
+}
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
 
 # Public API - main components that users should import
 __all__ = [
@@ -97,6 +106,8 @@ def create_emergency_detector():
     Returns:
         tuple: (feature_extractor, ml_manager, pattern_analyzer)
     """
+    from .pr3_ml_models import MLModelManager
+    
     feature_extractor = FeatureExtractor(window_size=30)
     ml_manager = MLModelManager()
     pattern_analyzer = PatternAnalyzer()
@@ -115,6 +126,15 @@ def get_pattern_info(pattern: EmergencyPattern) -> dict:
     """
     return EMERGENCY_SIGNATURES.get(pattern, {})
 
+# Built once at import rather than on every is_critical_pattern() call
+_CRITICAL_PATTERNS = frozenset({
+    EmergencyPattern.FUEL_LEAK,
+    EmergencyPattern.STRUCTURAL_FATIGUE,
+    EmergencyPattern.ELECTRICAL_FAILURE,
+    EmergencyPattern.SYSTEM_CASCADE,
+    EmergencyPattern.UNKNOWN_EMERGENCY
+})
+
 def is_critical_pattern(pattern: EmergencyPattern) -> bool:
     """
     Check if a pattern represents a critical emergency.
@@ -125,14 +145,7 @@ def is_critical_pattern(pattern: EmergencyPattern) -> bool:
     Returns:
         bool: True if pattern is critical, False otherwise
     """
-    critical_patterns = {
-        EmergencyPattern.FUEL_LEAK,
-        EmergencyPattern.STRUCTURAL_FATIGUE,
-        EmergencyPattern.ELECTRICAL_FAILURE,
-        EmergencyPattern.SYSTEM_CASCADE,
-        EmergencyPattern.UNKNOWN_EMERGENCY
-    }
-    return pattern in critical_patterns
+    return pattern in _CRITICAL_PATTERNS
 
 # Add convenience functions to __all__
 __all__.extend([
@@ -34,7 +34,7 @@ class AnomalySeverity(IntEnum):
     CRITICAL = 3
     EMERGENCY = 4
 
-@dataclass
+@dataclass(slots=True)
 class AnomalyScore:
     """Anomaly detection result"""
     is_anomaly: bool
@@ -54,7 +54,7 @@ class AnomalyScore:
         else:
             self.severity = AnomalySeverity.NORMAL
 
-@dataclass
+@dataclass(slots=True)
 class PatternResult:
     """ML pattern recognition result"""
     pattern_type: EmergencyPattern
@@ -67,7 +67,7 @@ class PatternResult:
     anomaly_score: float = 0.0
     timestamp: float = field(default_factory=time.time)
 
-@dataclass
+@dataclass(slots=True)
 class TelemetryData:
     """Standardized telemetry data structure"""
     rpm: float = 0.0
@@ -2,15 +2,35 @@
 """
 Feature Extractor - Updated for pattern types integration
 """
+from collections import deque
 from .pr1_pattern_types import TelemetryData, AnomalyScore
 from typing import Union, Dict, Optional
-import numpy as np
+
+# Shared read-only stand-in for a missing score; built once instead of on every extract() call
+_NO_ANOMALY = AnomalyScore(False, 0, 0)
+
+def _linear_slope(values) -> float:
+    """Least-squares slope of values against their index (same as np.polyfit(x, y, 1)[0])."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    sum_x = n * (n - 1) / 2
+    sum_x2 = (n - 1) * n * (2 * n - 1) / 6
+    sum_y = sum_xy = 0.0
+    for i, y in enumerate(values):
+        sum_y += y
+        sum_xy += i * y
+    return (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
 
 class FeatureExtractor:
     def __init__(self, window_size=10):
         self.window_size = window_size
-        self.feature_history = []
-        self.feature_names = [
+        self.feature_history = deque(maxlen=window_size)
+        # Raw per-tick values kept alongside feature_history so trends need no dict traversal
+        self._rpm_history = deque(maxlen=window_size)
+        self._vibration_history = deque(maxlen=window_size)
+        self._anomalous_history = deque(maxlen=window_size)
+        self.feature_names = (
             'rpm_value', 
             'oil_pressure_value',
             'vibration_value',
@@ -21,24 +41,29 @@ class FeatureExtractor:
             'rpm_trend',
             'vibration_increase',
             'anomaly_persistence'
-        ]
+        )
     
     def extract(self, telemetry, anomalies, correlation_data=None):
         """Ensure all feature vectors have consistent structure"""
-        # Convert inputs to dict if needed
-        tel_dict = telemetry if isinstance(telemetry, dict) else telemetry.to_dict()
+        # Read the three telemetry inputs directly; TelemetryData is not copied into a dict first
+        if isinstance(telemetry, dict):
+            rpm = telemetry.get('rpm', 0)
+            oil_pressure = telemetry.get('oil_pressure', 0)
+            vibration = telemetry.get('vibration', 0)
+        else:
+            rpm, oil_pressure, vibration = telemetry.rpm, telemetry.oil_pressure, telemetry.vibration
         anomalies = self._ensure_anomaly_dict(anomalies)
         
         # Initialize feature dict with default values
-        features = {name: 0.0 for name in self.feature_names}
+        features = dict.fromkeys(self.feature_names, 0.0)
         
         # Basic features
         features.update({
-            'rpm_value': tel_dict.get('rpm', 0),
-            'oil_pressure_value': tel_dict.get('oil_pressure', 0),
-            'vibration_value': tel_dict.get('vibration', 0),
-            'rpm_anomaly': anomalies.get('rpm', AnomalyScore(False, 0, 0)).normalized_score,
-            'oil_anomaly': anomalies.get('oil_pressure', AnomalyScore(False, 0, 0)).normalized_score
+            'rpm_value': rpm,
+            'oil_pressure_value': oil_pressure,
+            'vibration_value': vibration,
+            'rpm_anomaly': anomalies.get('rpm', _NO_ANOMALY).normalized_score,
+            'oil_anomaly': anomalies.get('oil_pressure', _NO_ANOMALY).normalized_score
         })
         
         # Correlation features
@@ -61,26 +86,23 @@ class FeatureExtractor:
         if isinstance(anomalies, dict):
             return anomalies
         return {
-            'rpm': anomalies.rpm if hasattr(anomalies, 'rpm') else AnomalyScore(False, 0, 0),
-            'oil_pressure': anomalies.oil_pressure if hasattr(anomalies, 'oil_pressure') else AnomalyScore(False, 0, 0)
+            'rpm': getattr(anomalies, 'rpm', _NO_ANOMALY),
+            'oil_pressure': getattr(anomalies, 'oil_pressure', _NO_ANOMALY)
         }
     
     def _update_history(self, features: dict):
         """Maintain feature history"""
         self.feature_history.append(features)
-        if len(self.feature_history) > self.window_size:
-            self.feature_history.pop(0)
+        self._rpm_history.append(features['rpm_value'])
+        self._vibration_history.append(features['vibration_value'])
+        self._anomalous_history.append(features['rpm_anomaly'] > 0.5 or features['oil_anomaly'] > 0.5)
     
     def _get_temporal_features(self) -> dict:
         """Calculate features over time window"""
-        rpm_values = [f['rpm_value'] for f in self.feature_history]
-        vib_values = [f['vibration_value'] for f in self.feature_history]
+        vib_values = self._vibration_history
         
         return {
-            'rpm_trend': np.polyfit(range(len(rpm_values)), rpm_values, 1)[0],
+            'rpm_trend': _linear_slope(self._rpm_history),
             'vibration_increase': vib_values[-1] - vib_values[0],
-            'anomaly_persistence': sum(
-                1 for f in self.feature_history 
-                if f['rpm_anomaly'] > 0.5 or f['oil_anomaly'] > 0.5
-            ) / len(self.feature_history)
+            'anomaly_persistence': sum(self._anomalous_history) / len(self._anomalous_history)
         }
\ No newline at end of file
@@ -39,7 +39,7 @@ class MLModelManager:
             # Convert to numpy arrays
             X = np.array([list(sample['features'].values()) for sample in training_data])
             y = np.array([sample['pattern_label'] for sample in training_data])
-            self.feature_names = list(training_data[0]['features'].keys())
+            self.feature_names = tuple(training_data[0]['features'])
             
             # Train-test split
             X_train, X_val, y_train, y_val = train_test_split(
@@ -103,8 +103,8 @@ class MLModelManager:
         if not self.is_trained:
             raise RuntimeError("Model must be trained before prediction")
         
-        # Convert features to scaled numpy array
-        X = np.array([list(features.values())])
+        # Convert features to scaled numpy array (filled straight from the dict, no interim list)
+        X = np.fromiter(features.values(), dtype=float, count=len(features)).reshape(1, -1)
         X_scaled = self.scaler.transform(X)
         return int(self.classifier.predict(X_scaled)[0])
     
@@ -16,23 +16,27 @@ class PatternAnalyzer:
                features: dict) -> PatternResult:
         """Generate final pattern result"""
         
-        # Get contributing features
+        pattern = ml_prediction['pattern']
+        probability = ml_prediction['probability']
+        
+        # Get contributing features (signature thresholds looked up once, not per feature)
+        thresholds = EMERGENCY_SIGNATURES[pattern]['thresholds']
         contributing = [
             f"{k}={v:.2f}" for k, v in features.items()
-            if v > EMERGENCY_SIGNATURES[ml_prediction['pattern']]['thresholds'].get(k, 0)
+            if v > thresholds.get(k, 0)
         ]
         
         # Calculate time to critical
         ttc = self._estimate_time_to_critical(
-            ml_prediction['pattern'],
-            ml_prediction['probability'],
+            pattern,
+            probability,
             features
         )
         
         return PatternResult(
-            pattern_type=ml_prediction['pattern'],
+            pattern_type=pattern,
             confidence=ml_prediction['confidence'],
-            probability=ml_prediction['probability'],
+            probability=probability,
             contributing_features=contributing,
             time_to_critical=ttc,
             recommended_action=ml_prediction['recommended_action'],
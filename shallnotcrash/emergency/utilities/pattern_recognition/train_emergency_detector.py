@@ -39,16 +39,16 @@ except ImportError:
 
 # Fallback implementations if custom modules are not available
 if not custom_modules_available:
-    from enum import Enum
+    from enum import IntEnum
     from dataclasses import dataclass
     
-    class EmergencyPattern(Enum):
+    class EmergencyPattern(IntEnum):
         NORMAL = 0
         ENGINE_DEGRADATION = 1
         FUEL_LEAK = 2
         STRUCTURAL_FATIGUE = 3
     
-    class AnomalySeverity(Enum):
+    class AnomalySeverity(IntEnum):
         NORMAL = 0
         LOW = 1
         MEDIUM = 2
@@ -86,7 +86,7 @@ if not custom_modules_available:
             for key, anomaly in anomalies.items():
                 features[f'{key}_anomaly'] = float(anomaly.is_anomaly)
                 features[f'{key}_score'] = float(anomaly.normalized_score)
-                features[f'{key}_severity'] = float(anomaly.severity.value)
+                features[f'{key}_severity'] = float(anomaly.severity)
             
             # Correlation features
             for key, corr in correlation_data.items():
@@ -1,7 +1,7 @@
 # In shallnotcrash/fg_interface/core.py
 
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Sequence
 import time
 
 from .protocols.telnet import TelnetProtocol
@@ -64,6 +64,26 @@ class FGConnection:
                 data={"property": property_path, "error_details": str(e)}
             )
 
+    def get_many(self, property_paths: Sequence[str]) -> Dict[str, Any]:
+        """Reads several properties in one round-trip; values keep the order of property_paths.
+
+        A property whose reply could not be parsed has None as its value.
+        """
+        if not self._protocol:
+            return self._format_response(success=False, message="Not connected")
+
+        try:
+            values = self._protocol.get_many(property_paths)
+            return self._format_response(
+                success=True, message=f"Read {len(values)} properties",
+                data={"properties": list(property_paths), "values": values}
+            )
+        except Exception as e:
+            return self._format_response(
+                success=False, message="Failed to read properties",
+                data={"properties": list(property_paths), "error_details": str(e)}
+            )
+
     # --- PROPOSED NEW METHOD ---
     def set(self, property_path: str, value: Any) -> Dict[str, Any]:
         """Writes a property and returns a standardized JSON response."""
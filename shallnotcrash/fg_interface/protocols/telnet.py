@@ -1,9 +1,19 @@
 # In shallnotcrash/fg_interface/protocols/telnet.py
 
 import socket
-from typing import Any
+from typing import Any, List, Optional, Sequence
 from ..exceptions import FGCommError
 
+# Encoded 'get' commands keyed by property path (or tuple of paths); paths are static constants.
+_GET_COMMANDS = {}
+
+def _encode_get(property_paths) -> bytes:
+    cmd = _GET_COMMANDS.get(property_paths)
+    if cmd is None:
+        paths = (property_paths,) if isinstance(property_paths, str) else property_paths
+        cmd = _GET_COMMANDS[property_paths] = "".join(f"get {path}\r\n" for path in paths).encode()
+    return cmd
+
 class TelnetProtocol:
     """Handles low-level Telnet communication with FlightGear."""
     
@@ -19,14 +29,53 @@ class TelnetProtocol:
         
         # Store the timeout for later use in get/set
         self.timeout = timeout
+        # Replies still owed by an interrupted batch, and bytes already received towards them;
+        # they are discarded before the next read so replies never pair with the wrong property.
+        self._stale_replies = 0
+        self._stale_buffer = b""
     
     def get(self, property_path: str) -> str:
         """Sends 'get <property>' and returns the value."""
-        cmd = f"get {property_path}\r\n".encode()
+        cmd = _encode_get(property_path)
         # [MODIFICATION 3] Use the stored timeout value for consistency
         self.socket.settimeout(self.timeout) 
+        buffer = self._skip_stale_replies() if self._stale_replies else b""
         self.socket.send(cmd)
-        return self._parse_response(self.socket.recv(1024).decode())
+        try:
+            reply = buffer + self.socket.recv(1024)
+        except OSError:
+            self._stale_replies += 1  # The reply may still arrive; drop it before the next read
+            raise
+        return self._parse_response(reply.decode())
+
+    def get_many(self, property_paths: Sequence[str]) -> List[Optional[float]]:
+        """Pipelines one 'get' per property and reads all replies in a single round-trip.
+
+        A reply that cannot be parsed (e.g. an empty value) yields None in its slot instead of
+        failing the whole batch; only socket errors raise FGCommError.
+        """
+        cmd = _encode_get(tuple(property_paths))
+        sent = False
+        buffer = b""
+        try:
+            self.socket.settimeout(self.timeout)
+            buffer = self._skip_stale_replies() if self._stale_replies else b""
+            self.socket.sendall(cmd)
+            sent = True
+            while buffer.count(b"\n") < len(property_paths):
+                chunk = self.socket.recv(4096)
+                if not chunk:
+                    raise FGCommError("Connection closed during batched read")
+                buffer += chunk
+        except (OSError, FGCommError) as e:
+            if sent:  # Every reply of this batch, read or not, is dropped before the next read
+                self._stale_replies += len(property_paths)
+                self._stale_buffer = buffer
+            if isinstance(e, FGCommError):
+                raise
+            raise FGCommError(f"Batched read failed: {e}") from e
+        replies = buffer.decode().split("\n")[:len(property_paths)]
+        return [self._parse_reply(reply) for reply in replies]
 
     def set(self, property_path: str, value: Any):
         """Sends 'set <property> <value>'."""
@@ -46,6 +95,28 @@ class TelnetProtocol:
             except (IndexError, ValueError):
                  raise FGCommError(f"Failed to parse response: {response}") from e
 
+    def _skip_stale_replies(self) -> bytes:
+        """Reads and drops the replies owed by an interrupted batch; returns any bytes after them."""
+        while self._stale_replies:
+            newline = self._stale_buffer.find(b"\n")
+            if newline < 0:
+                chunk = self.socket.recv(4096)
+                if not chunk:
+                    raise FGCommError("Connection closed while discarding stale replies")
+                self._stale_buffer += chunk
+            else:
+                self._stale_buffer = self._stale_buffer[newline + 1:]
+                self._stale_replies -= 1
+        buffer, self._stale_buffer = self._stale_buffer, b""
+        return buffer
+
+    def _parse_reply(self, reply: str) -> Optional[float]:
+        """_parse_response for one reply of a batch; None if it does not hold a number."""
+        try:
+            return self._parse_response(reply)
+        except FGCommError:
+            return None
+
     def close(self):
         """Closes the socket connection."""
         self.socket.close()
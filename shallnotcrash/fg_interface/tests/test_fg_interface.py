@@ -119,6 +119,50 @@ class TestTelnetProtocol(unittest.TestCase):
         with self.assertRaises(FGCommError):
             protocol.get("/position/altitude-ft")
 
+    def test_batched_property_read(self):
+        """Test pipelined read of several properties in one round-trip"""
+        self.socket_instance.recv.side_effect = [b"1234.5\r\n", b"250.0\r\n"]
+        protocol = TelnetProtocol("localhost", 5500)
+        result = protocol.get_many(["/position/altitude-ft", "/orientation/heading-deg"])
+
+        self.assertEqual(result, [1234.5, 250.0])
+        self.socket_instance.sendall.assert_called_once_with(
+            b"get /position/altitude-ft\r\nget /orientation/heading-deg\r\n"
+        )
+
+    def test_batched_read_with_empty_reply(self):
+        """Test that one unparseable reply only blanks its own slot"""
+        self.socket_instance.recv.side_effect = [b"1234.5\r\n\r\n250.0\r\n"]
+        protocol = TelnetProtocol("localhost", 5500)
+        result = protocol.get_many(["/position/altitude-ft", "/engines/engine/vibration",
+                                    "/orientation/heading-deg"])
+
+        self.assertEqual(result, [1234.5, None, 250.0])
+
+    def test_batched_read_connection_closed(self):
+        """Test batched read when FlightGear closes the socket mid-reply"""
+        self.socket_instance.recv.side_effect = [b"1234.5\r\n", b""]
+        protocol = TelnetProtocol("localhost", 5500)
+
+        with self.assertRaises(FGCommError):
+            protocol.get_many(["/position/altitude-ft", "/orientation/heading-deg"])
+
+    def test_batched_read_timeout_discards_stale_replies(self):
+        """Test that replies left over from a timed-out batch never reach the next read"""
+        paths = ["/position/altitude-ft", "/orientation/heading-deg", "/velocities/airspeed-kt"]
+        self.socket_instance.recv.side_effect = [b"1000.0\r\n", socket.timeout("timed out")]
+        protocol = TelnetProtocol("localhost", 5500)
+
+        with self.assertRaises(FGCommError):
+            protocol.get_many(paths)
+
+        # The two late replies of the first batch arrive ahead of the second batch's replies
+        self.socket_instance.recv.side_effect = [b"90.0\r\n100.0\r\n", b"2000.0\r\n180.0\r\n110.0\r\n"]
+        self.assertEqual(protocol.get_many(paths), [2000.0, 180.0, 110.0])
+
+        self.socket_instance.recv.side_effect = [b"2100.0\r\n"]
+        self.assertEqual(protocol.get("/position/altitude-ft"), 2100.0)
+
     def test_connection_error(self):
         """Test connection error during property read"""
         self.socket_instance.send.side_effect = socket.error("Connection failed")
@@ -6,6 +6,10 @@ from ..constants import PlannerConstants, AircraftProfile
 from .coordinates import destination_point, calculate_bearing
 from .calculations import calculate_turn_radius
 
+# Per-step glide distance and altitude loss depend only on profile constants.
+_DIST_PER_STEP_NM = (AircraftProfile.GLIDE_SPEED_KTS * PlannerConstants.TIME_DELTA_SEC) / 3600.0
+_BASE_ALT_LOSS_FT = (_DIST_PER_STEP_NM * PlannerConstants.FEET_PER_NAUTICAL_MILE) / AircraftProfile.GLIDE_RATIO
+
 def _average_headings(h1_deg: float, h2_deg: float) -> float:
     h1_rad, h2_rad = math.radians(h1_deg), math.radians(h2_deg)
     avg_x = (math.cos(h1_rad) + math.cos(h2_rad)) / 2.0
@@ -16,8 +20,8 @@ def get_reachable_states(current_state: AircraftState, distance_to_goal_nm: floa
     """
     Enhanced reachable states with proper turn radius constraints and adaptive resolution.
     """
-    dist_per_step_nm = (AircraftProfile.GLIDE_SPEED_KTS * PlannerConstants.TIME_DELTA_SEC) / 3600.0
-    base_alt_loss_ft = (dist_per_step_nm * PlannerConstants.FEET_PER_NAUTICAL_MILE) / AircraftProfile.GLIDE_RATIO
+    dist_per_step_nm = _DIST_PER_STEP_NM
+    base_alt_loss_ft = _BASE_ALT_LOSS_FT
     
     # Calculate minimum turn radius for current speed
     min_turn_radius_nm = calculate_turn_radius(current_state.airspeed_kts)
@@ -55,9 +59,8 @@ def get_reachable_states(current_state: AircraftState, distance_to_goal_nm: floa
         # Use more accurate position calculation for turns
         if abs_turn > 0:
             # For turns, calculate arc movement
-            turn_radius_nm = calculate_turn_radius(current_state.airspeed_kts)
             arc_angle_deg = turn_deg
-            arc_distance_nm = (abs(arc_angle_deg) * math.pi / 180) * turn_radius_nm
+            arc_distance_nm = (abs(arc_angle_deg) * math.pi / 180) * min_turn_radius_nm
             
             # Calculate position along turn arc
             avg_heading = _average_headings(current_state.heading_deg, new_heading)
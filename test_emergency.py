@@ -117,7 +117,7 @@ def telemetry_worker(state: dict):
                 }
 
             # --- Enhanced Debug Output ---
-            elapsed_time = time.time() - pattern_recognizer.startup_time if pattern_recognizer else 0
+            elapsed_time = time.monotonic() - pattern_recognizer.startup_time if pattern_recognizer else 0
             grace_remaining = max(0, pattern_recognizer.STARTUP_GRACE_PERIOD - elapsed_time) if pattern_recognizer else 0
             
             print("\n" + "="*80)